@@ -1,13 +1,47 @@
 """AMP AI Agent — understands commands and controls Spotify via Claude."""
 
-from typing import List, Dict
+import hashlib
+import re
+import time
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
-from amp.spotify.player import SpotifyPlayer
+from amp.config import get_config
 from amp.llm.llm_provider import ClaudeProvider
+from amp.utils.json_utils import dumps
 from amp.utils.logger import get_logger
+from amp.utils.semantic_cache import SemanticCache
+
+if TYPE_CHECKING:
+    from amp.spotify.player import SpotifyPlayer
 
 logger = get_logger("agent")
 
+# Tools whose result depends on live player state and must never be replayed from cache
+UNCACHEABLE_TOOLS = {"get_now_playing", "set_volume"}
+
+# Tools whose own result string is already fit to show the user, so the
+# follow-up Claude call that phrases it naturally can be skipped
+PRESENTABLE_TOOLS = {
+    "pause_music", "skip_track", "previous_track", "get_now_playing", "set_volume",
+    "add_to_queue", "create_playlist", "save_current_track", "toggle_shuffle",
+}
+
+# Maximum number of exact-match Claude responses kept in memory
+EXACT_CACHE_SIZE = 256
+
+# Unambiguous commands dispatched directly without asking Claude: (pattern, tool, args)
+DISPATCH = [
+    (re.compile(r"^(pause|stop)$"), "pause_music", {}),
+    (re.compile(r"^(play|resume)$"), "play_music", {}),
+    (re.compile(r"^(skip|next)$"), "skip_track", {}),
+    (re.compile(r"^(back|prev|previous)$"), "previous_track", {}),
+    (re.compile(r"^(like|save)$"), "save_current_track", {}),
+    (re.compile(r"^volume\s+(\d{1,3})%?$"), "set_volume", lambda m: {"volume": int(m.group(1))}),
+    (re.compile(r"^shuffle\s+(on|off)$"), "toggle_shuffle", lambda m: {"enabled": m.group(1) == "on"}),
+    (re.compile(r"^play\s+(.+)$"), "play_music", lambda m: {"query": m.group(1)}),
+]
+
 
 class AMPAgent:
     """AI brain that understands natural language and controls Spotify."""
@@ -32,74 +66,142 @@ When users give commands:
 
 If unsure, ask for clarification. Be concise in responses."""
 
-    def __init__(self, spotify: SpotifyPlayer):
+    def __init__(self, spotify: "SpotifyPlayer"):
         self.spotify = spotify
         self.llm = ClaudeProvider()
-        self.history: List[Dict] = []
+        config = get_config()
+        # Bounded window of user/assistant turns sent to Claude
+        self.history: deque = deque(maxlen=config.memory.max_conversation_history * 2)
+        self._cache = SemanticCache()
+        self._exact_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._exact_cache_ttl = config.memory.cache_ttl_seconds
         logger.info("AMP Agent initialized")
 
+    def _play_music(self, args: Dict) -> str:
+        query = args.get("query", "")
+        if query:
+            return self.spotify.search_and_play(query)
+        return self.spotify.play()
+
+    def _search_music(self, args: Dict) -> str:
+        tracks = self.spotify.search(args["query"])
+        if tracks:
+            return "\n".join(
+                f"  {i+1}. {t['name']} - {t['artists']}"
+                for i, t in enumerate(tracks)
+            )
+        return "No results found"
+
+    def _get_now_playing(self, args: Dict) -> str:
+        track = self.spotify.get_current_track()
+        if track:
+            status = "Playing" if track["is_playing"] else "Paused"
+            return f"{status}: {track['name']} by {track['artists']}"
+        return "Nothing playing"
+
+    def _get_recommendations(self, args: Dict) -> str:
+        tracks = self.spotify.get_recommendations(args.get("mood"))
+        if tracks:
+            return "Recommendations:\n" + "\n".join(
+                f"  - {t['name']} - {t['artists']}" for t in tracks
+            )
+        return "Couldn't get recommendations"
+
+    # Tool name -> handler(self, args)
+    _DISPATCH = {
+        "play_music": _play_music,
+        "pause_music": lambda self, a: self.spotify.pause(),
+        "skip_track": lambda self, a: self.spotify.next_track(),
+        "previous_track": lambda self, a: self.spotify.previous_track(),
+        "search_music": _search_music,
+        "get_now_playing": _get_now_playing,
+        "set_volume": lambda self, a: self.spotify.set_volume(a["volume"]),
+        "add_to_queue": lambda self, a: self.spotify.add_to_queue(a["query"]),
+        "get_recommendations": _get_recommendations,
+        "create_playlist": lambda self, a: self.spotify.create_playlist(
+            a["name"], a.get("mood"), a.get("count", 20)
+        ),
+        "save_current_track": lambda self, a: self.spotify.save_current(),
+        "toggle_shuffle": lambda self, a: self.spotify.shuffle(a["enabled"]),
+    }
+
     def _execute_function(self, name: str, args: Dict) -> str:
         """Execute a Spotify function by name."""
-        if name == "play_music":
-            query = args.get("query", "")
-            if query:
-                return self.spotify.search_and_play(query)
-            return self.spotify.play()
-        elif name == "pause_music":
-            return self.spotify.pause()
-        elif name == "skip_track":
-            return self.spotify.next_track()
-        elif name == "previous_track":
-            return self.spotify.previous_track()
-        elif name == "search_music":
-            tracks = self.spotify.search(args["query"])
-            if tracks:
-                return "\n".join(
-                    f"  {i+1}. {t['name']} - {t['artists']}"
-                    for i, t in enumerate(tracks)
-                )
-            return "No results found"
-        elif name == "get_now_playing":
-            track = self.spotify.get_current_track()
-            if track:
-                status = "Playing" if track["is_playing"] else "Paused"
-                return f"{status}: {track['name']} by {track['artists']}"
-            return "Nothing playing"
-        elif name == "set_volume":
-            return self.spotify.set_volume(args["volume"])
-        elif name == "add_to_queue":
-            return self.spotify.add_to_queue(args["query"])
-        elif name == "get_recommendations":
-            tracks = self.spotify.get_recommendations(args.get("mood"))
-            if tracks:
-                return "Recommendations:\n" + "\n".join(
-                    f"  - {t['name']} - {t['artists']}" for t in tracks
-                )
-            return "Couldn't get recommendations"
-        elif name == "create_playlist":
-            return self.spotify.create_playlist(
-                args["name"], args.get("mood"), args.get("count", 20)
-            )
-        elif name == "save_current_track":
-            return self.spotify.save_current()
-        elif name == "toggle_shuffle":
-            return self.spotify.shuffle(args["enabled"])
-        return "Unknown command"
+        fn = self._DISPATCH.get(name)
+        return fn(self, args) if fn else "Unknown command"
+
+    def _dispatch_direct(self, user_input: str) -> Optional[str]:
+        """Run trivial commands locally. Returns None if Claude is needed."""
+        text = user_input.lower().strip()
+        for pattern, fn_name, args in DISPATCH:
+            match = pattern.match(text)
+            if match:
+                fn_args = args(match) if callable(args) else args
+                logger.info("Direct dispatch: %s(%s)", fn_name, fn_args)
+                return self._execute_function(fn_name, fn_args)
+        return None
+
+    def _exact_cache_key(self, messages: List[Dict], use_tools: bool) -> str:
+        payload = dumps([self.SYSTEM_PROMPT, messages, use_tools], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _exact_cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._exact_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self._exact_cache_ttl:
+            del self._exact_cache[key]
+            return None
+        self._exact_cache.move_to_end(key)
+        return result
+
+    def _exact_cache_set(self, key: str, result: Dict[str, Any]) -> None:
+        self._exact_cache[key] = (time.monotonic(), result)
+        self._exact_cache.move_to_end(key)
+        if len(self._exact_cache) > EXACT_CACHE_SIZE:
+            self._exact_cache.popitem(last=False)
 
     def process(self, user_input: str) -> str:
         """Process user input and return a response."""
         self.history.append({"role": "user", "content": user_input})
 
-        # Keep last 10 messages for context
-        messages = self.history[-10:]
+        messages = list(self.history)
 
         try:
-            # Ask Claude (with tools)
-            result = self.llm.chat(
-                messages=messages,
-                system_prompt=self.SYSTEM_PROMPT,
-                use_tools=True,
-            )
+            # Skip the model entirely for unambiguous commands
+            response_text = self._dispatch_direct(user_input)
+            if response_text is not None:
+                self.history.append({"role": "assistant", "content": response_text})
+                return response_text
+
+            # Replay a semantically identical earlier command without calling Claude
+            embedding = self._cache.embed(user_input)
+            hit = self._cache.lookup(embedding)
+            if hit:
+                fn_name, fn_args, _ = hit
+                logger.info("Semantic cache hit: %s(%s)", fn_name, fn_args)
+                # Show the fresh result: the stored reply described an earlier
+                # run and would hide a failure or stale tracks
+                response_text = self._execute_function(fn_name, fn_args)
+                self.history.append({"role": "assistant", "content": response_text})
+                return response_text
+
+            # Ask Claude (with tools), reusing the answer for an identical prompt
+            cache_key = None
+            result = None
+            if self._exact_cache_ttl > 0:
+                cache_key = self._exact_cache_key(messages, True)
+                result = self._exact_cache_get(cache_key)
+
+            if result is None:
+                result = self.llm.chat(
+                    messages=messages,
+                    system_prompt=self.SYSTEM_PROMPT,
+                    use_tools=True,
+                )
+                if cache_key:
+                    self._exact_cache_set(cache_key, result)
 
             # If Claude wants to call a tool
             if result["tool_use"]:
@@ -107,29 +209,35 @@ If unsure, ask for clarification. Be concise in responses."""
                 fn_name = tool["name"]
                 fn_args = tool["input"]
 
-                logger.info(f"Executing tool: {fn_name}({fn_args})")
+                logger.info("Executing tool: %s(%s)", fn_name, fn_args)
                 fn_result = self._execute_function(fn_name, fn_args)
 
-                # Send the tool result back to Claude for a natural response
-                tool_messages = messages + [
-                    {
-                        "role": "assistant",
-                        "content": [
-                            {"type": "tool_use", "id": tool["id"], "name": fn_name, "input": fn_args}
-                        ],
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "tool_result", "tool_use_id": tool["id"], "content": fn_result}
-                        ],
-                    },
-                ]
-
-                response_text = self.llm.chat_simple(
-                    messages=tool_messages,
-                    system_prompt=self.SYSTEM_PROMPT,
-                )
+                if fn_name in PRESENTABLE_TOOLS:
+                    response_text = fn_result
+                else:
+                    # Send the tool result back to Claude for a natural response
+                    tool_turn = [
+                        {
+                            "role": "assistant",
+                            "content": [
+                                {"type": "tool_use", "id": tool["id"], "name": fn_name, "input": fn_args}
+                            ],
+                        },
+                        {
+                            "role": "user",
+                            "content": [
+                                {"type": "tool_result", "tool_use_id": tool["id"], "content": fn_result}
+                            ],
+                        },
+                    ]
+
+                    response_text = self.llm.chat_simple(
+                        messages=[*messages, *tool_turn],
+                        system_prompt=self.SYSTEM_PROMPT,
+                    )
+
+                if fn_name not in UNCACHEABLE_TOOLS:
+                    self._cache.store(embedding, fn_name, fn_args, response_text)
             else:
                 response_text = result["text"] or "I'm not sure what to do with that."
 
@@ -137,5 +245,5 @@ If unsure, ask for clarification. Be concise in responses."""
             return response_text
 
         except Exception as e:
-            logger.error(f"Agent processing failed: {e}")
+            logger.error("Agent processing failed: %s", e)
             return f"Error: {str(e)}"
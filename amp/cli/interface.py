@@ -1,14 +1,17 @@
 """AMP CLI interface — beautiful terminal UI."""
 
 import os
+import re
 import sys
 import time
 import subprocess
 import platform
 import shutil
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-# Fix Windows console encoding for Unicode characters (Rich UI)
-if sys.platform == "win32":
+# Fix Windows console encoding for Unicode characters (Rich UI), unless already UTF-8
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower() not in ("utf-8", "utf8"):
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
@@ -21,49 +24,103 @@ from rich.markdown import Markdown
 from rich import box
 
 from amp.config import init_config
-from amp.spotify.player import SpotifyPlayer
-from amp.spotify.youtube_player import YouTubePlayer
-from amp.agent.amp_agent import AMPAgent
 from amp.utils.logger import setup_logging, get_logger
 
+# Player backends and the agent pull in spotipy/ytmusicapi/anthropic,
+# so they are imported inside main() only once they're actually needed.
+if TYPE_CHECKING:
+    from amp.spotify.player import SpotifyPlayer
+
 logger = get_logger("cli")
 console = Console(force_terminal=True)
 
+# Progress bar segments, prebuilt for every fill level
+_BAR_WIDTH = 30
+_BAR_FILLED = ["━" * i for i in range(_BAR_WIDTH + 1)]
+_BAR_EMPTY = ["─" * i for i in range(_BAR_WIDTH + 1)]
 
-def ensure_spotify_running() -> bool:
-    """Check if Spotify is running, launch it if not. Returns True if ready."""
-    system = platform.system()
+# Short-lived memo of the player's current track, shared by all renders
+_TRACK_TTL = 2.0
+_track_cache: dict = {"data": None, "ts": 0.0}
 
-    # Check if Spotify is already running
+# Commands after which the Now Playing panel is refreshed
+_NP_TRIGGER = re.compile(r"\b(play|skip|next|back|prev)")
+
+_SYSTEM = platform.system()
+_IS_WIN, _IS_MAC, _IS_LINUX = _SYSTEM == "Windows", _SYSTEM == "Darwin", _SYSTEM == "Linux"
+
+
+def _spotify_running() -> bool:
+    """Check the process table for a running Spotify client."""
+    try:
+        import psutil
+    except ImportError:
+        return _spotify_running_subprocess()
+
+    names = {"spotify.exe", "spotify"}
+    try:
+        return any(
+            p.info["name"] and p.info["name"].lower() in names
+            for p in psutil.process_iter(["name"])
+        )
+    except Exception:
+        return False
+
+
+def _spotify_running_subprocess() -> bool:
+    """Slower fallback for when psutil is not installed: ask tasklist/pgrep."""
     try:
-        if system == "Windows":
+        if _IS_WIN:
             result = subprocess.run(
                 ["tasklist", "/FI", "IMAGENAME eq Spotify.exe"],
                 capture_output=True, text=True, timeout=5
             )
-            if "Spotify.exe" in result.stdout:
-                return True
-        elif system == "Darwin":  # macOS
+            return "Spotify.exe" in result.stdout
+        if _IS_MAC or _IS_LINUX:
             result = subprocess.run(
-                ["pgrep", "-x", "Spotify"],
+                ["pgrep", "-x", "Spotify" if _IS_MAC else "spotify"],
                 capture_output=True, timeout=5
             )
-            if result.returncode == 0:
-                return True
-        elif system == "Linux":
-            result = subprocess.run(
-                ["pgrep", "-x", "spotify"],
-                capture_output=True, timeout=5
-            )
-            if result.returncode == 0:
-                return True
+            return result.returncode == 0
     except Exception:
         pass
+    return False
+
+
+def _wait_for_api(probe: Optional[Callable[[], Any]], timeout: float = 2.0) -> None:
+    """Poll the Web API until the freshly launched client answers, for at most timeout seconds.
+
+    A client that is still starting up answers current_playback with 204
+    (None), not an error, so only a non-None result counts as ready.
+    """
+    if probe is None:
+        time.sleep(timeout)  # No client to ask, give Spotify time to fully initialize
+        return
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if probe() is not None:
+                return
+        except Exception:
+            pass
+        time.sleep(0.2)
+
+
+def ensure_spotify_running(probe: Optional[Callable[[], Any]] = None) -> bool:
+    """Check if Spotify is running, launch it if not. Returns True if ready.
+
+    ``probe`` is an optional Web API call (e.g. ``current_playback``) used to
+    detect when a freshly launched client is ready to accept commands.
+    """
+    # Check if Spotify is already running
+    if _spotify_running():
+        return True
 
     # Spotify not running — try to launch it
     console.print("[yellow]  Spotify not running. Launching...[/yellow]")
     try:
-        if system == "Windows":
+        if _IS_WIN:
             # Try Microsoft Store version first, then desktop
             spotify_path = shutil.which("spotify")
             if spotify_path:
@@ -73,39 +130,22 @@ def ensure_spotify_running() -> bool:
                     ["cmd", "/c", "start", "spotify:"],
                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
                 )
-        elif system == "Darwin":
+        elif _IS_MAC:
             subprocess.Popen(["open", "-a", "Spotify"])
-        elif system == "Linux":
+        elif _IS_LINUX:
             subprocess.Popen(["spotify"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
         # Wait for Spotify to start up
         console.print("[dim]  Waiting for Spotify to start...[/dim]")
-        for _ in range(10):
-            time.sleep(1.5)
-            try:
-                if system == "Windows":
-                    result = subprocess.run(
-                        ["tasklist", "/FI", "IMAGENAME eq Spotify.exe"],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    if "Spotify.exe" in result.stdout:
-                        time.sleep(2)  # Extra time for Spotify to fully initialize
-                        console.print("[green]  Spotify launched![/green]")
-                        return True
-                elif system == "Darwin":
-                    result = subprocess.run(["pgrep", "-x", "Spotify"], capture_output=True, timeout=5)
-                    if result.returncode == 0:
-                        time.sleep(2)
-                        console.print("[green]  Spotify launched![/green]")
-                        return True
-                elif system == "Linux":
-                    result = subprocess.run(["pgrep", "-x", "spotify"], capture_output=True, timeout=5)
-                    if result.returncode == 0:
-                        time.sleep(2)
-                        console.print("[green]  Spotify launched![/green]")
-                        return True
-            except Exception:
-                pass
+        delay = 0.1
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline:
+            if _spotify_running():
+                _wait_for_api(probe)
+                console.print("[green]  Spotify launched![/green]")
+                return True
+            time.sleep(delay)
+            delay = min(delay * 1.7, 1.5)
 
         console.print("[red]  Could not launch Spotify. Please open it manually.[/red]")
         return False
@@ -116,6 +156,50 @@ def ensure_spotify_running() -> bool:
         return False
 
 
+def get_current_track_cached(player: "SpotifyPlayer") -> Optional[dict]:
+    """Return the current track, refetching at most every _TRACK_TTL seconds."""
+    now = time.monotonic()
+    if now - _track_cache["ts"] > _TRACK_TTL:
+        _track_cache["data"] = player.get_current_track()
+        _track_cache["ts"] = now
+    return _track_cache["data"]
+
+
+def invalidate_track_cache() -> None:
+    """Force the next render to fetch fresh playback state."""
+    _track_cache["ts"] = 0.0
+
+
+def connect_spotify_parallel(factory: Callable[[], "SpotifyPlayer"]) -> Optional["SpotifyPlayer"]:
+    """Connect to Spotify in a background thread while the client launches.
+
+    The thread builds the player and reads ``user_id``, which forces the
+    OAuth token fetch and the first API round trip that would otherwise
+    happen on the first command. Returns None if the connection failed so
+    the caller can retry sequentially.
+    """
+    result: list = []
+
+    def connect() -> None:
+        try:
+            player = factory()
+            player.user_id
+            result.append(player)
+        except Exception as e:
+            logger.warning("Background Spotify connect failed: %s", e)
+
+    def probe() -> Any:
+        # Same readiness check as the sequential path, once the player exists
+        loader.join()
+        return result[0].sp.current_playback() if result else None
+
+    loader = threading.Thread(target=connect, daemon=True)
+    loader.start()
+    ensure_spotify_running(probe=probe)
+    loader.join()
+    return result[0] if result else None
+
+
 def create_header() -> Panel:
     """Create the AMP header."""
     title = Text()
@@ -124,16 +208,15 @@ def create_header() -> Panel:
     return Panel(title, box=box.ROUNDED, border_style="magenta")
 
 
-def create_now_playing(spotify: SpotifyPlayer) -> Panel:
+def create_now_playing(spotify: "SpotifyPlayer") -> Panel:
     """Create now playing display."""
-    track = spotify.get_current_track()
+    track = get_current_track_cached(spotify)
     if track:
         status = "Now Playing" if track["is_playing"] else "Paused"
-        progress = track["progress_ms"] / track["duration_ms"] if track["duration_ms"] else 0
-        bar_width = 30
-        filled = int(progress * bar_width)
-        filled = max(0, min(bar_width - 1, filled))
-        bar = "━" * filled + "○" + "─" * (bar_width - filled - 1)
+        duration = track["duration_ms"]
+        filled = (track["progress_ms"] * _BAR_WIDTH) // duration if duration else 0
+        filled = max(0, min(_BAR_WIDTH - 1, filled))
+        bar = _BAR_FILLED[filled] + "○" + _BAR_EMPTY[_BAR_WIDTH - 1 - filled]
 
         content = Text()
         content.append(f"{status}\n", style="bold green" if track["is_playing"] else "bold yellow")
@@ -151,6 +234,18 @@ def create_now_playing(spotify: SpotifyPlayer) -> Panel:
         )
 
 
+def wait_for_track_change(player: "SpotifyPlayer", prev_uri: Optional[str], timeout: float = 0.5) -> None:
+    """Poll until the player reports a different track, or the timeout expires."""
+    invalidate_track_cache()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        track = get_current_track_cached(player)
+        if track and track["uri"] != prev_uri:
+            return
+        invalidate_track_cache()
+        time.sleep(0.05)
+
+
 def execute_shell_command(command: str) -> None:
     """Execute a shell command and display output."""
     try:
@@ -237,10 +332,14 @@ def main(command, config_path):
 
     console.print(create_header())
 
+    from amp.agent.amp_agent import AMPAgent
+
     # Initialize music player based on config
     music_provider = config.music_provider.lower()
 
     if music_provider == "youtube":
+        from amp.spotify.youtube_player import YouTubePlayer
+
         try:
             player = YouTubePlayer()
             agent = AMPAgent(player)
@@ -249,11 +348,24 @@ def main(command, config_path):
             console.print(f"[red]Failed to connect to YouTube Music: {e}[/red]")
             return
     else:
-        # Ensure Spotify is running (auto-launch if needed)
-        ensure_spotify_running()
+        from amp.spotify.player import SpotifyPlayer
+
+        player = None
+        if config.experimental_parallel_startup:
+            # Overlap the OAuth handshake with the Spotify launch wait
+            player = connect_spotify_parallel(SpotifyPlayer)
+
+        if player is None:
+            try:
+                player = SpotifyPlayer()
+            except Exception as e:
+                console.print(f"[red]Failed to connect to Spotify: {e}[/red]")
+                return
+
+            # Ensure Spotify is running (auto-launch if needed)
+            ensure_spotify_running(probe=player.sp.current_playback)
 
         try:
-            player = SpotifyPlayer()
             agent = AMPAgent(player)
             console.print("[green]✓ Connected to Spotify[/green]")
         except Exception as e:
@@ -283,51 +395,60 @@ def main(command, config_path):
             lower = user_input.lower().strip()
 
             # Built-in commands
-            if lower in ["quit", "exit", "q"]:
-                console.print("[dim]Goodbye![/dim]")
-                break
-            elif lower in ["help", "?"]:
-                show_help()
-                continue
-            elif lower in ["now", "playing", "np"]:
-                console.print(create_now_playing(player))
-                continue
-            elif lower == "clear":
-                console.clear()
-                console.print(create_header())
-                continue
-            elif lower == "pwd":
-                console.print(f"[cyan]{os.getcwd()}[/cyan]")
-                continue
+            match lower.split(" ", 1):
+                case ["quit" | "exit" | "q"]:
+                    console.print("[dim]Goodbye![/dim]")
+                    break
+                case ["help" | "?"]:
+                    show_help()
+                    continue
+                case ["now" | "playing" | "np"]:
+                    console.print(create_now_playing(player))
+                    continue
+                case ["clear"]:
+                    console.clear()
+                    console.print(create_header())
+                    continue
+                case ["pwd"]:
+                    console.print(f"[cyan]{os.getcwd()}[/cyan]")
+                    continue
+                case ["cd", _]:
+                    # Change directory command
+                    path = user_input.strip()[3:].strip()
+                    try:
+                        os.chdir(path)
+                        console.print(f"[green]Changed to: {os.getcwd()}[/green]")
+                    except FileNotFoundError:
+                        console.print(f"[red]Directory not found: {path}[/red]")
+                    except PermissionError:
+                        console.print(f"[red]Permission denied: {path}[/red]")
+                    except Exception as e:
+                        console.print(f"[red]Error: {e}[/red]")
+                    continue
 
             # Shell commands (prefixed with !)
             if user_input.startswith("!"):
                 execute_shell_command(user_input[1:].strip())
                 continue
 
-            # Change directory command
-            if lower.startswith("cd "):
-                path = user_input[3:].strip()
-                try:
-                    os.chdir(path)
-                    console.print(f"[green]Changed to: {os.getcwd()}[/green]")
-                except FileNotFoundError:
-                    console.print(f"[red]Directory not found: {path}[/red]")
-                except PermissionError:
-                    console.print(f"[red]Permission denied: {path}[/red]")
-                except Exception as e:
-                    console.print(f"[red]Error: {e}[/red]")
-                continue
+            # Remember the current track so we can tell when a play/skip lands
+            show_now_playing = _NP_TRIGGER.search(lower) is not None
+            if show_now_playing:
+                current = get_current_track_cached(player)
+                prev_uri = current["uri"] if current else None
 
             # Process with AI
             with console.status("[magenta]Thinking...[/magenta]"):
                 response = agent.process(user_input)
+            # Any command may have changed playback (pause, volume, ...), so the
+            # next Now Playing render must not reuse the pre-command state
+            invalidate_track_cache()
 
             console.print(f"\n[bold cyan]AMP:[/bold cyan] {response}\n")
 
             # Show now playing after play commands
-            if any(word in lower for word in ["play", "skip", "next", "back", "prev"]):
-                time.sleep(0.5)
+            if show_now_playing:
+                wait_for_track_change(player, prev_uri)
                 console.print(create_now_playing(player))
                 console.print()
 
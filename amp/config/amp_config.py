@@ -1,16 +1,43 @@
 """AMP Configuration Management."""
 
 import os
+import sys
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
-try:
-    import tomli
-except ImportError:
-    tomli = None
+from amp.utils.json_utils import dumps, loads
+from amp.utils.logger import get_logger
 
-from dotenv import load_dotenv
+logger = get_logger("config")
+
+# On-disk cache of the parsed TOML file (never contains secrets). It holds the
+# raw TOML data, not an AMPConfig, so new fields and defaults apply on upgrade.
+CONFIG_CACHE_PATH = Path.home() / ".cache" / "amp" / "config.json"
+CONFIG_CACHE_VERSION = 1
+
+
+def _find_env_file() -> Optional[Path]:
+    """Locate .env the way python-dotenv's find_dotenv() does: walk up from this module."""
+    for directory in Path(os.path.abspath(__file__)).parents:
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+DEFAULT_SPOTIFY_SCOPES = (
+    "user-read-playback-state",
+    "user-modify-playback-state",
+    "user-read-currently-playing",
+    "playlist-read-private",
+    "playlist-modify-private",
+    "playlist-modify-public",
+    "user-library-read",
+    "user-library-modify",
+    "user-top-read",
+    "user-read-recently-played",
+)
 
 
 @dataclass
@@ -20,18 +47,7 @@ class SpotifyConfig:
     client_secret: str = ""
     redirect_uri: str = "http://localhost:8888/callback"
     cache_path: str = ".spotify_cache"
-    scopes: list = field(default_factory=lambda: [
-        "user-read-playback-state",
-        "user-modify-playback-state",
-        "user-read-currently-playing",
-        "playlist-read-private",
-        "playlist-modify-private",
-        "playlist-modify-public",
-        "user-library-read",
-        "user-library-modify",
-        "user-top-read",
-        "user-read-recently-played",
-    ])
+    scopes: tuple = DEFAULT_SPOTIFY_SCOPES
 
 
 @dataclass
@@ -89,34 +105,89 @@ class AMPConfig:
     log_level: str = "INFO"
     log_file: Optional[str] = None
     music_provider: str = "youtube"  # "spotify" or "youtube"
+    experimental_parallel_startup: bool = False
 
     @classmethod
     def load(cls, config_path: Optional[str] = None, env_file: Optional[str] = None) -> "AMPConfig":
         """Load configuration from TOML file and environment variables."""
-        if env_file:
-            load_dotenv(env_file)
-        else:
-            load_dotenv()
+        # Only pay for python-dotenv when there is something to load
+        env_path = env_file or _find_env_file()
+        if env_path:
+            from dotenv import load_dotenv
 
-        config = cls()
+            load_dotenv(env_path)
 
-        if config_path and Path(config_path).exists() and tomli:
-            config._load_toml(config_path)
+        if config_path and Path(config_path).exists():
+            config = cls._load_toml_cached(config_path)
+        else:
+            config = cls()
 
+        # Environment (including secrets) is always read fresh
         config._load_env()
         return config
 
-    def _load_toml(self, path: str) -> None:
-        """Load settings from TOML file."""
+    @classmethod
+    def _load_toml_cached(cls, path: str) -> "AMPConfig":
+        """Build a config from a TOML file, reusing the cached parse while the file is unchanged."""
+        config = cls()
+        data = cls._read_toml_cached(path)
+        if data is not None:
+            config._apply_toml(data)
+        return config
+
+    @classmethod
+    def _read_toml_cached(cls, path: str) -> Optional[Dict[str, Any]]:
+        """Parse a TOML file, or return the cached parse keyed by path, mtime and size."""
+        stat = os.stat(path)
+        key = [CONFIG_CACHE_VERSION, os.path.abspath(path), stat.st_mtime_ns, stat.st_size]
+        use_cache = not os.getenv("AMP_DEBUG")
+
+        if use_cache:
+            try:
+                with open(CONFIG_CACHE_PATH, "rb") as f:
+                    cached = loads(f.read())
+                if cached["key"] == key:
+                    return cached["data"]
+            except Exception:
+                pass
+
+        data = cls._read_toml(path)
+        if data is None:
+            return None
+
+        if use_cache:
+            try:
+                CONFIG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                with open(CONFIG_CACHE_PATH, "w") as f:
+                    f.write(dumps({"key": key, "data": data}))
+            except (OSError, TypeError):
+                pass
+
+        return data
+
+    @staticmethod
+    def _read_toml(path: str) -> Optional[Dict[str, Any]]:
+        """Parse a TOML file. Returns None if no TOML parser is available."""
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                logger.warning("tomli is not installed, ignoring config file %s", path)
+                return None
+
         with open(path, "rb") as f:
-            data = tomli.load(f)
+            return tomllib.load(f)
 
+    def _apply_toml(self, data: Dict[str, Any]) -> None:
+        """Apply settings parsed from a TOML file."""
         if "spotify" in data:
             sp = data["spotify"]
             self.spotify.redirect_uri = sp.get("redirect_uri", self.spotify.redirect_uri)
             self.spotify.cache_path = sp.get("cache_path", self.spotify.cache_path)
             if "scopes" in sp:
-                self.spotify.scopes = sp["scopes"]
+                self.spotify.scopes = tuple(sp["scopes"])
 
         if "llm" in data:
             llm = data["llm"]
@@ -148,31 +219,40 @@ class AMPConfig:
             self.debug = app.get("debug", self.debug)
             self.log_level = app.get("log_level", self.log_level)
             self.log_file = app.get("log_file", self.log_file)
+            self.experimental_parallel_startup = app.get(
+                "experimental_parallel_startup", self.experimental_parallel_startup
+            )
 
     def _load_env(self) -> None:
         """Load settings from environment variables."""
+        env = os.environ
+
         # Music provider
-        self.music_provider = os.getenv("MUSIC_PROVIDER", "youtube").lower()
+        self.music_provider = env.get("MUSIC_PROVIDER", "youtube").lower()
 
         # Spotify
-        self.spotify.client_id = os.getenv("SPOTIFY_CLIENT_ID", "")
-        self.spotify.client_secret = os.getenv("SPOTIFY_CLIENT_SECRET", "")
-        if os.getenv("SPOTIFY_REDIRECT_URI"):
-            self.spotify.redirect_uri = os.getenv("SPOTIFY_REDIRECT_URI")
+        self.spotify.client_id = env.get("SPOTIFY_CLIENT_ID", "")
+        self.spotify.client_secret = env.get("SPOTIFY_CLIENT_SECRET", "")
+        redirect_uri = env.get("SPOTIFY_REDIRECT_URI")
+        if redirect_uri:
+            self.spotify.redirect_uri = redirect_uri
 
         # LLM API keys
-        self.llm.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY", "")
-        self.llm.openai_api_key = os.getenv("OPENAI_API_KEY", "")
-        self.llm.google_api_key = os.getenv("GOOGLE_API_KEY", "")
+        self.llm.anthropic_api_key = env.get("ANTHROPIC_API_KEY", "")
+        self.llm.openai_api_key = env.get("OPENAI_API_KEY", "")
+        self.llm.google_api_key = env.get("GOOGLE_API_KEY", "")
 
-        if os.getenv("AMP_LLM_PROVIDER"):
-            self.llm.default_provider = os.getenv("AMP_LLM_PROVIDER")
+        provider = env.get("AMP_LLM_PROVIDER")
+        if provider:
+            self.llm.default_provider = provider
 
-        if os.getenv("AMP_DEBUG"):
-            self.debug = os.getenv("AMP_DEBUG", "").lower() in ("true", "1", "yes")
+        debug = env.get("AMP_DEBUG")
+        if debug is not None:
+            self.debug = debug.lower() in ("true", "1", "yes")
 
-        if os.getenv("AMP_LOG_LEVEL"):
-            self.log_level = os.getenv("AMP_LOG_LEVEL")
+        log_level = env.get("AMP_LOG_LEVEL")
+        if log_level:
+            self.log_level = log_level
 
     def validate(self) -> list:
         """Validate configuration and return list of errors."""
@@ -1,9 +1,15 @@
 """Claude LLM provider for AMP."""
 
+import asyncio
+import functools
 import json
+import threading
+import time
+import types
 from typing import List, Dict, Optional, Any
 
 import anthropic
+import httpx
 
 from amp.config import get_config
 from amp.utils.logger import get_logger
@@ -11,8 +17,9 @@ from amp.utils.logger import get_logger
 logger = get_logger("llm.claude")
 
 
-# Tool definitions for Claude's tool_use API
-TOOLS = [
+# Tool definitions for Claude's tool_use API. A tuple so the same schema
+# object is shared, unmodified, by every request.
+TOOLS = (
     {
         "name": "play_music",
         "description": "Play a specific song, artist, or resume playback",
@@ -118,20 +125,61 @@ TOOLS = [
             "required": ["enabled"]
         }
     }
-]
+)
+
+# Shape of chat()'s return value; copied per response
+_EMPTY_RESULT = types.MappingProxyType({"text": None, "tool_use": None})
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_system(system_prompt: str) -> List[Dict[str, Any]]:
+    """System prompt as a block marked for prompt caching.
+
+    The cache breakpoint covers everything before it, so the tools and the
+    system prompt are reused across turns instead of being processed again.
+    """
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
 
 
 class ClaudeProvider:
     """Anthropic Claude LLM provider."""
 
+    # Process-wide clients keyed by API key, so every provider shares one
+    # keep-alive connection pool instead of paying a fresh TLS handshake
+    _clients: Dict[str, anthropic.Anthropic] = {}
+    _clients_lock = threading.Lock()
+
     def __init__(self):
         config = get_config()
-        self.client = anthropic.Anthropic(api_key=config.llm.anthropic_api_key)
+        self._api_key = config.llm.anthropic_api_key
+        self.client = self._shared_client(self._api_key)
         self.model = config.llm.anthropic_model
         self.max_tokens = config.llm.anthropic_max_tokens
         self.temperature = getattr(config.llm, "anthropic_temperature", 0.7)
+        # Per-request arguments that never change; chat() adds system/messages
+        self._kwargs_notools = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        }
+        self._kwargs_tools = {**self._kwargs_notools, "tools": TOOLS}
         logger.info(f"Claude provider initialized (model: {self.model})")
 
+    @classmethod
+    def _shared_client(cls, api_key: str) -> anthropic.Anthropic:
+        with cls._clients_lock:
+            client = cls._clients.get(api_key)
+            if client is None:
+                client = anthropic.Anthropic(
+                    api_key=api_key,
+                    # Default client keeps the SDK's timeout and redirect settings; only the pool grows
+                    http_client=anthropic.DefaultHttpxClient(
+                        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+                    ),
+                )
+                cls._clients[api_key] = client
+            return client
+
     def chat(
         self,
         messages: List[Dict],
@@ -144,25 +192,25 @@ class ClaudeProvider:
             - "text": str or None (text response)
             - "tool_use": dict or None ({"name": str, "input": dict, "id": str})
         """
-        kwargs = {
-            "model": self.model,
-            "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
-            "system": system_prompt,
-            "messages": messages,
-        }
-
-        if use_tools:
-            kwargs["tools"] = TOOLS
-
-        response = self.client.messages.create(**kwargs)
+        kwargs = self._kwargs_tools if use_tools else self._kwargs_notools
+        response = self.client.messages.create(
+            **kwargs,
+            system=_cached_system(system_prompt),
+            messages=messages,
+        )
+        return self._parse_response_with_tools(response)
 
-        result = {"text": None, "tool_use": None}
+    @staticmethod
+    def _parse_response_with_tools(response: Any) -> Dict[str, Any]:
+        """Extract the text and tool_use blocks from a Messages API response."""
+        result = _EMPTY_RESULT.copy()
 
+        # Later blocks win, so with several tool calls the last one is used
         for block in response.content:
-            if block.type == "text":
+            block_type = block.type
+            if block_type == "text":
                 result["text"] = block.text
-            elif block.type == "tool_use":
+            elif block_type == "tool_use":
                 result["tool_use"] = {
                     "id": block.id,
                     "name": block.name,
@@ -171,18 +219,97 @@ class ClaudeProvider:
 
         return result
 
+    @staticmethod
+    def _parse_response_text_only(response: Any) -> str:
+        """Return the first text block of a Messages API response, or ""."""
+        for block in response.content:
+            if block.type == "text":
+                return block.text
+        return ""
+
+    async def chat_many(
+        self,
+        batched_messages: List[List[Dict]],
+        system_prompt: str,
+        concurrency: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Send independent conversations concurrently (no tools).
+
+        At most ``concurrency`` requests are in flight at once. Results are
+        returned in input order, each shaped like ``chat()``'s return value.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # One async client per call: its connection pool is bound to the running event loop
+        async with anthropic.AsyncAnthropic(
+            api_key=self._api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_keepalive_connections=concurrency, max_connections=concurrency),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            ),
+        ) as client:
+
+            async def send(messages: List[Dict]) -> Dict[str, Any]:
+                async with semaphore:
+                    response = await client.messages.create(
+                        **self._kwargs_notools,
+                        system=system_prompt,
+                        messages=messages,
+                    )
+                return self._parse_response_with_tools(response)
+
+            return await asyncio.gather(*(send(m) for m in batched_messages))
+
+    def submit_batch(
+        self,
+        batched_messages: List[List[Dict]],
+        system_prompt: str,
+        poll_interval: float = 10.0,
+        timeout: float = 3600.0,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Run conversations through the Message Batches API and wait for the results.
+
+        Batches are cheaper but may take minutes, so this suits offline jobs
+        only. Entries that did not succeed come back as None. If the batch
+        has not ended after ``timeout`` seconds it is cancelled and
+        TimeoutError is raised.
+        """
+        requests = [
+            {
+                "custom_id": f"amp-{i}",
+                "params": {**self._kwargs_notools, "system": system_prompt, "messages": messages},
+            }
+            for i, messages in enumerate(batched_messages)
+        ]
+
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted message batch {batch.id} ({len(requests)} requests)")
+
+        deadline = time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                self.client.messages.batches.cancel(batch.id)
+                raise TimeoutError(f"Message batch {batch.id} did not finish within {timeout:.0f}s; cancelled")
+            time.sleep(poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                index = int(entry.custom_id.rpartition("-")[2])
+                results[index] = self._parse_response_with_tools(entry.result.message)
+            else:
+                logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+
+        return results
+
     def chat_simple(self, messages: List[Dict], system_prompt: str) -> str:
         """Simple chat without tools — just get a text response."""
         response = self.client.messages.create(
             model=self.model,
             max_tokens=150,
             temperature=self.temperature,
-            system=system_prompt,
+            system=_cached_system(system_prompt),
             messages=messages,
         )
-
-        for block in response.content:
-            if block.type == "text":
-                return block.text
-
-        return ""
+        return self._parse_response_text_only(response)
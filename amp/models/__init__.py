@@ -2,6 +2,7 @@
 
 from .user import User
 from .track import Track
+from .playback_state import PlaybackState
 from .playlist import Playlist
 from .task import Task, TaskStatus
 from .action_result import ActionResult, ActionStatus
@@ -9,6 +10,7 @@ from .action_result import ActionResult, ActionStatus
 __all__ = [
     "User",
     "Track",
+    "PlaybackState",
     "Playlist",
     "Task",
     "TaskStatus",
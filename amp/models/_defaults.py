@@ -0,0 +1,22 @@
+"""Private defaults and helpers shared by the models."""
+
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+# Fallback for missing nested objects in API responses; read-only so no
+# caller can change what every other lookup sees
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _ns_to_iso(ns: int) -> str:
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+def _cached_iso(ns: Optional[int], cached: Optional[Tuple[int, str]]) -> Optional[Tuple[int, str]]:
+    """(ns, ISO string) for an epoch-ns timestamp, reusing cached if it is for the same ns."""
+    if ns is None:
+        return None
+    if cached is not None and cached[0] == ns:
+        return cached
+    return ns, _ns_to_iso(ns)
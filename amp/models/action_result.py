@@ -1,12 +1,24 @@
 """ActionResult model for action execution results."""
 
 from dataclasses import dataclass, field
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, Tuple
 from datetime import datetime
 from enum import Enum
+from itertools import islice
+import sys
+import time
 
+from amp.utils.json_utils import dumps
 
-class ActionStatus(Enum):
+from ._defaults import _cached_iso
+
+
+# Items kept on a result; only the first LLM_ITEMS are ever rendered
+MAX_ITEMS = 100
+LLM_ITEMS = 10
+
+
+class ActionStatus(str, Enum):
     """Status of an action execution."""
     SUCCESS = "success"
     FAILURE = "failure"
@@ -15,7 +27,7 @@ class ActionStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     """Result of executing an action."""
 
@@ -30,12 +42,23 @@ class ActionResult:
     error_details: Optional[str] = None
 
     execution_time_ms: int = 0
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
     action_type: str = ""
     parameters: Dict[str, Any] = field(default_factory=dict)
     follow_up_actions: List[str] = field(default_factory=list)
 
+    # (ns, ISO string) for timestamp_ns, built on first to_dict()
+    _timestamp_iso: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.action_type = sys.intern(self.action_type)
+        n = len(self.items)
+        if n > MAX_ITEMS:
+            if not self.total_items:
+                self.total_items = n
+            self.items = self.items[:MAX_ITEMS]
+
     @property
     def is_success(self) -> bool:
         return self.status == ActionStatus.SUCCESS
@@ -44,6 +67,10 @@ class ActionResult:
     def is_failure(self) -> bool:
         return self.status == ActionStatus.FAILURE
 
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
     @property
     def has_data(self) -> bool:
         return self.data is not None or len(self.items) > 0
@@ -61,6 +88,7 @@ class ActionResult:
         return cls(status=ActionStatus.PARTIAL, message=message, data=data, **kwargs)
 
     def to_dict(self) -> dict:
+        self._timestamp_iso = _cached_iso(self.timestamp_ns, self._timestamp_iso)
         return {
             "status": self.status.value,
             "message": self.message,
@@ -70,18 +98,24 @@ class ActionResult:
             "error_code": self.error_code,
             "error_details": self.error_details,
             "execution_time_ms": self.execution_time_ms,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._timestamp_iso[1],
             "action_type": self.action_type,
             "parameters": self.parameters,
         }
 
+    def to_json(self) -> str:
+        """Serialize to_dict() as a JSON string."""
+        return dumps(self.to_dict())
+
     def to_llm_response(self) -> str:
         if self.is_success:
-            response = self.message
-            if self.items:
-                response += "\n" + "\n".join(f"  - {item}" for item in self.items[:10])
-                if len(self.items) > 10:
-                    response += f"\n  ... and {len(self.items) - 10} more"
+            n = max(len(self.items), self.total_items) if self.items else 0
+            if not n:
+                return self.message
+            head = "\n".join("  - " + str(item) for item in islice(self.items, LLM_ITEMS))
+            response = f"{self.message}\n{head}"
+            if n > LLM_ITEMS:
+                response += f"\n  ... and {n - LLM_ITEMS} more"
             return response
         else:
             return f"Error: {self.message}" + (f" ({self.error_details})" if self.error_details else "")
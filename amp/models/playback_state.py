@@ -0,0 +1,58 @@
+"""PlaybackState model for the live state of the Spotify player."""
+
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+
+from amp.utils.json_utils import dumps
+
+from ._defaults import _EMPTY
+
+
+@dataclass(slots=True)
+class PlaybackState:
+    """Transient playback state, kept apart from the catalog Track it refers to."""
+
+    track_uri: str = ""
+    is_playing: bool = False
+    progress_ms: int = 0
+    duration_ms: int = 0
+    played_at: Optional[datetime] = None
+
+    @property
+    def progress_str(self) -> str:
+        """Get progress as mm:ss string."""
+        seconds = self.progress_ms // 1000
+        return f"{seconds // 60}:{seconds % 60:02d}"
+
+    @property
+    def progress_percent(self) -> float:
+        """Get playback progress as percentage (0-1)."""
+        if self.duration_ms == 0:
+            return 0.0
+        return self.progress_ms / self.duration_ms
+
+    @classmethod
+    def from_spotify_dict(cls, data: dict) -> "PlaybackState":
+        """Create PlaybackState from a Spotify current-playback response."""
+        item = data.get("item") or _EMPTY
+        return cls(
+            track_uri=item.get("uri", ""),
+            is_playing=data.get("is_playing", False),
+            progress_ms=data.get("progress_ms") or 0,
+            duration_ms=item.get("duration_ms", 0),
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for storage."""
+        return {
+            "track_uri": self.track_uri,
+            "is_playing": self.is_playing,
+            "progress_ms": self.progress_ms,
+            "duration_ms": self.duration_ms,
+            "played_at": self.played_at.isoformat() if self.played_at else None,
+        }
+
+    def to_json(self) -> str:
+        """Serialize to_dict() as a JSON string."""
+        return dumps(self.to_dict())
@@ -1,13 +1,16 @@
 """Playlist model representing a Spotify playlist."""
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Iterable
 from datetime import datetime
 
+from amp.utils.json_utils import dumps, loads
+
+from ._defaults import _EMPTY
 from .track import Track
 
 
-@dataclass
+@dataclass(slots=True)
 class Playlist:
     """Represents a Spotify playlist."""
 
@@ -37,14 +40,20 @@ class Playlist:
     created_at: Optional[datetime] = None
     last_modified: Optional[datetime] = None
 
+    # Derived from uri on first access
+    _id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def id(self) -> str:
         """Extract playlist ID from URI."""
-        return self.uri.split(":")[-1] if self.uri else ""
+        if self._id is None:
+            self._id = self.uri.rpartition(":")[2]
+        return self._id
 
     @property
     def duration_ms(self) -> int:
         """Get total duration of all tracks."""
+        # Summed on read: tracks is a public list, so a running total could go stale
         return sum(t.duration_ms for t in self.tracks)
 
     @property
@@ -60,8 +69,9 @@ class Playlist:
     @classmethod
     def from_spotify_dict(cls, data: dict, include_tracks: bool = False) -> "Playlist":
         """Create Playlist from Spotify API response."""
-        images = data.get("images", [])
-        owner = data.get("owner", {})
+        images = data.get("images") or ()
+        owner = data.get("owner") or _EMPTY
+        tracks = data.get("tracks") or _EMPTY
 
         playlist = cls(
             uri=data.get("uri", ""),
@@ -71,21 +81,27 @@ class Playlist:
             owner_name=owner.get("display_name", ""),
             is_public=data.get("public", True),
             is_collaborative=data.get("collaborative", False),
-            total_tracks=data.get("tracks", {}).get("total", 0),
+            total_tracks=tracks.get("total", 0),
             image_url=images[0]["url"] if images else None,
-            followers=data.get("followers", {}).get("total", 0),
+            followers=(data.get("followers") or _EMPTY).get("total", 0),
             snapshot_id=data.get("snapshot_id", ""),
-            external_url=data.get("external_urls", {}).get("spotify"),
+            external_url=(data.get("external_urls") or _EMPTY).get("spotify"),
         )
 
-        if include_tracks and "tracks" in data:
-            track_items = data["tracks"].get("items", [])
-            for item in track_items:
-                if item and item.get("track"):
-                    playlist.tracks.append(Track.from_spotify_dict(item["track"]))
+        if include_tracks and tracks:
+            playlist.tracks = [
+                Track.from_spotify_dict(item["track"])
+                for item in tracks.get("items") or ()
+                if item and item.get("track")
+            ]
 
         return playlist
 
+    @classmethod
+    def from_spotify_bytes(cls, raw: bytes, include_tracks: bool = False) -> "Playlist":
+        """Create Playlist from a raw Spotify API response body."""
+        return cls.from_spotify_dict(loads(raw), include_tracks=include_tracks)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
         return {
@@ -103,6 +119,10 @@ class Playlist:
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
 
+    def to_json(self) -> str:
+        """Serialize to_dict() as a JSON string."""
+        return dumps(self.to_dict())
+
     def add_track(self, track: Track) -> None:
         """Add a track to the playlist."""
         self.tracks.append(track)
@@ -117,6 +137,16 @@ class Playlist:
                 return True
         return False
 
+    def remove_many(self, uris: Iterable[str]) -> int:
+        """Remove every track whose URI is in uris. Returns the number removed."""
+        uris = set(uris)
+        kept = [t for t in self.tracks if t.uri not in uris]
+        removed = len(self.tracks) - len(kept)
+        if removed:
+            self.tracks = kept
+            self.total_tracks = len(kept)
+        return removed
+
     def __str__(self) -> str:
         return f"{self.name} ({self.total_tracks} tracks)"
 
@@ -1,13 +1,19 @@
 """Task model for tracking AI agent tasks."""
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from enum import Enum
-import uuid
+import itertools
+import sys
+import time
 
+from amp.utils.json_utils import dumps
 
-class TaskStatus(Enum):
+from ._defaults import _cached_iso
+
+
+class TaskStatus(str, Enum):
     """Status of a task."""
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -16,11 +22,21 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+# Task ids only need to be unique within this process
+_task_counter = itertools.count(1)
+
+
+def _next_task_id() -> str:
+    return f"t{next(_task_counter):07x}"
+
+
+@dataclass(slots=True)
 class Task:
     """Represents an AI agent task."""
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=_next_task_id)
     description: str = ""
     status: TaskStatus = TaskStatus.PENDING
 
@@ -38,26 +54,50 @@ class Task:
     attempts: int = 0
     max_attempts: int = 3
 
-    # Timing
-    created_at: datetime = field(default_factory=datetime.now)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    # Timing, as epoch nanoseconds; datetimes are built only when read
+    created_at_ns: int = field(default_factory=time.time_ns)
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
 
     # Context
     user_input: str = ""
     llm_response: str = ""
 
+    # (ns, ISO string) per timing field, reused while that timestamp is unchanged
+    _created_iso: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
+    _started_iso: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
+    _completed_iso: Optional[Tuple[int, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # action_type is one of a handful of tool names
+        self.action_type = sys.intern(self.action_type)
+
     @property
     def is_complete(self) -> bool:
         """Check if task is in a terminal state."""
-        return self.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+        return self.status in _TERMINAL_STATUSES
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
+
+    @property
+    def started_at(self) -> Optional[datetime]:
+        if self.started_at_ns is None:
+            return None
+        return datetime.fromtimestamp(self.started_at_ns / 1e9)
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        if self.completed_at_ns is None:
+            return None
+        return datetime.fromtimestamp(self.completed_at_ns / 1e9)
 
     @property
     def duration_ms(self) -> Optional[int]:
         """Get task duration in milliseconds."""
-        if self.started_at and self.completed_at:
-            delta = self.completed_at - self.started_at
-            return int(delta.total_seconds() * 1000)
+        if self.started_at_ns is not None and self.completed_at_ns is not None:
+            return (self.completed_at_ns - self.started_at_ns) // 1_000_000
         return None
 
     @property
@@ -68,25 +108,25 @@ class Task:
     def start(self) -> None:
         """Mark task as started."""
         self.status = TaskStatus.IN_PROGRESS
-        self.started_at = datetime.now()
+        self.started_at_ns = time.time_ns()
         self.attempts += 1
 
     def complete(self, result: str) -> None:
         """Mark task as completed."""
         self.status = TaskStatus.COMPLETED
-        self.completed_at = datetime.now()
+        self.completed_at_ns = time.time_ns()
         self.result = result
 
     def fail(self, error: str) -> None:
         """Mark task as failed."""
         self.status = TaskStatus.FAILED
-        self.completed_at = datetime.now()
+        self.completed_at_ns = time.time_ns()
         self.error = error
 
     def cancel(self) -> None:
         """Cancel the task."""
         self.status = TaskStatus.CANCELLED
-        self.completed_at = datetime.now()
+        self.completed_at_ns = time.time_ns()
 
     def add_subtask(self, subtask: "Task") -> None:
         """Add a subtask."""
@@ -95,6 +135,9 @@ class Task:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage/logging."""
+        self._created_iso = _cached_iso(self.created_at_ns, self._created_iso)
+        self._started_iso = _cached_iso(self.started_at_ns, self._started_iso)
+        self._completed_iso = _cached_iso(self.completed_at_ns, self._completed_iso)
         return {
             "id": self.id,
             "description": self.description,
@@ -105,12 +148,16 @@ class Task:
             "error": self.error,
             "attempts": self.attempts,
             "user_input": self.user_input,
-            "created_at": self.created_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self._created_iso[1],
+            "started_at": self._started_iso[1] if self._started_iso else None,
+            "completed_at": self._completed_iso[1] if self._completed_iso else None,
             "duration_ms": self.duration_ms,
         }
 
+    def to_json(self) -> str:
+        """Serialize to_dict() as a JSON string."""
+        return dumps(self.to_dict())
+
     def __str__(self) -> str:
         return f"Task({self.id}: {self.description} [{self.status.value}])"
 
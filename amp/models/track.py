@@ -3,9 +3,14 @@
 from dataclasses import dataclass, field
 from typing import Optional, List
 from datetime import datetime
+import sys
 
+from amp.utils.json_utils import dumps, loads
 
-@dataclass
+from ._defaults import _EMPTY
+
+
+@dataclass(slots=True)
 class Track:
     """Represents a Spotify track with all relevant metadata."""
 
@@ -27,24 +32,27 @@ class Track:
     instrumentalness: float = 0.0
     acousticness: float = 0.0
 
-    # Playback state (when currently playing)
-    is_playing: bool = False
-    progress_ms: int = 0
-
-    # Metadata
+    # Metadata (live playback state lives in PlaybackState)
     added_at: Optional[datetime] = None
-    played_at: Optional[datetime] = None
     play_count: int = 0
 
+    # Derived strings, computed on first access (uri/artists are not expected to change)
+    _id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _artists_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def id(self) -> str:
         """Extract track ID from URI."""
-        return self.uri.split(":")[-1] if self.uri else ""
+        if self._id is None:
+            self._id = self.uri.rpartition(":")[2]
+        return self._id
 
     @property
     def artists_str(self) -> str:
         """Get artists as comma-separated string."""
-        return ", ".join(self.artists)
+        if self._artists_str is None:
+            self._artists_str = ", ".join(self.artists)
+        return self._artists_str
 
     @property
     def duration_str(self) -> str:
@@ -52,39 +60,29 @@ class Track:
         seconds = self.duration_ms // 1000
         return f"{seconds // 60}:{seconds % 60:02d}"
 
-    @property
-    def progress_str(self) -> str:
-        """Get progress as mm:ss string."""
-        seconds = self.progress_ms // 1000
-        return f"{seconds // 60}:{seconds % 60:02d}"
-
-    @property
-    def progress_percent(self) -> float:
-        """Get playback progress as percentage (0-1)."""
-        if self.duration_ms == 0:
-            return 0.0
-        return self.progress_ms / self.duration_ms
-
     @classmethod
-    def from_spotify_dict(cls, data: dict, playback_data: Optional[dict] = None) -> "Track":
-        """Create Track from Spotify API response."""
-        track = cls(
+    def from_spotify_dict(cls, data: dict) -> "Track":
+        """Create Track from Spotify API response.
+
+        Artist and album names repeat across a library, so they are interned.
+        """
+        album = data.get("album") or _EMPTY
+        return cls(
             uri=data.get("uri", ""),
             name=data.get("name", "Unknown"),
-            artists=[a["name"] for a in data.get("artists", [])],
-            album=data.get("album", {}).get("name", ""),
-            album_uri=data.get("album", {}).get("uri", ""),
+            artists=[sys.intern(a["name"]) for a in data.get("artists") or ()],
+            album=sys.intern(album.get("name", "")),
+            album_uri=album.get("uri", ""),
             duration_ms=data.get("duration_ms", 0),
             popularity=data.get("popularity", 0),
             explicit=data.get("explicit", False),
             preview_url=data.get("preview_url"),
         )
 
-        if playback_data:
-            track.is_playing = playback_data.get("is_playing", False)
-            track.progress_ms = playback_data.get("progress_ms", 0)
-
-        return track
+    @classmethod
+    def from_spotify_bytes(cls, raw: bytes) -> "Track":
+        """Create Track from a raw Spotify API response body."""
+        return cls.from_spotify_dict(loads(raw))
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
@@ -106,6 +104,10 @@ class Track:
             "play_count": self.play_count,
         }
 
+    def to_json(self) -> str:
+        """Serialize to_dict() as a JSON string."""
+        return dumps(self.to_dict())
+
     def __str__(self) -> str:
         return f"{self.name} by {self.artists_str}"
 
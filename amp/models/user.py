@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+from amp.utils.json_utils import dumps
 
-@dataclass
+
+@dataclass(slots=True)
 class User:
     """Represents a Spotify user with preferences."""
 
@@ -76,6 +78,10 @@ class User:
             "total_playlists_created": self.total_playlists_created,
         }
 
+    def to_json(self) -> str:
+        """Serialize to_dict() as a JSON string."""
+        return dumps(self.to_dict())
+
     @classmethod
     def from_dict(cls, data: dict) -> "User":
         """Create User from stored dictionary."""
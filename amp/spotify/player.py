@@ -1,31 +1,94 @@
 """Spotify player service for AMP."""
 
-from typing import Optional, List, Dict
-
-import spotipy
-from spotipy.oauth2 import SpotifyOAuth
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple
 
 from amp.config import get_config
 from amp.utils.logger import get_logger
 from amp.utils.audio_utils import get_mood_features
+from amp.utils.cache_manager import cache
+from amp.utils.retry_handler import debounce
+from amp.utils.rate_limiter import TokenBucket, RateLimitedClient
 
 logger = get_logger("spotify")
 
+# playlist_add_items accepts at most this many URIs per request
+PLAYLIST_ADD_LIMIT = 100
+
+# Concurrent requests for bulk operations; well under Spotify's rate limit
+MAX_WORKERS = 8
+
+# Client-side pacing, just under Spotify's ~25 requests/second
+REQUESTS_PER_SECOND = 20
+
+
+def _build_session():
+    """Pooled requests session sized for the batch thread pool.
+
+    Mirrors spotipy's own retry policy (which it only installs on sessions it
+    creates), including honouring Retry-After on 429.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retries = Retry(
+        total=3,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS * 2, max_retries=retries)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
 
 class SpotifyPlayer:
     """Handles all Spotify interactions."""
 
     def __init__(self):
+        # Imported here so startup doesn't pay for spotipy unless Spotify is used
+        import spotipy
+        from spotipy.oauth2 import SpotifyOAuth
+
         config = get_config()
-        self.sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
-            client_id=config.spotify.client_id,
-            client_secret=config.spotify.client_secret,
-            redirect_uri=config.spotify.redirect_uri,
-            scope=" ".join(config.spotify.scopes),
-            cache_path=config.spotify.cache_path,
-        ))
+        # One keep-alive pool shared by API calls and token refreshes
+        session = _build_session()
+        self._bucket = TokenBucket(capacity=REQUESTS_PER_SECOND, refill_rate=REQUESTS_PER_SECOND)
+        # Every self.sp.* call waits for a token, so bursts are paced instead of hitting 429
+        self.sp = RateLimitedClient(spotipy.Spotify(
+            auth_manager=SpotifyOAuth(
+                client_id=config.spotify.client_id,
+                client_secret=config.spotify.client_secret,
+                redirect_uri=config.spotify.redirect_uri,
+                scope=" ".join(config.spotify.scopes),
+                cache_path=config.spotify.cache_path,
+                requests_session=session,
+            ),
+            requests_session=session,
+        ), self._bucket)
+        self._user_id: Optional[str] = None
+        self._pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="spotify")
         logger.info("Spotify client initialized")
 
+    @property
+    def user_id(self) -> str:
+        """Current user's id, fetched once per client."""
+        if self._user_id is None:
+            self._user_id = self.sp.current_user()["id"]
+        return self._user_id
+
+    @cache(ttl=600, key_prefix="top", method=True)
+    def _top_tracks(self) -> Tuple[str, ...]:
+        """Ids of the user's recent top tracks."""
+        top = self.sp.current_user_top_tracks(limit=5, time_range="short_term")
+        return tuple(t["id"] for t in top["items"])
+
     def get_current_track(self) -> Optional[Dict]:
         """Get currently playing track."""
         try:
@@ -48,6 +111,8 @@ class SpotifyPlayer:
 
     def play(self, uri: Optional[str] = None) -> str:
         """Play music. If URI provided, play that track/album/playlist."""
+        from spotipy.exceptions import SpotifyException  # already loaded by __init__
+
         try:
             if uri:
                 if "track" in uri:
@@ -57,11 +122,12 @@ class SpotifyPlayer:
             else:
                 self.sp.start_playback()
             return "Playing"
-        except spotipy.exceptions.SpotifyException as e:
+        except SpotifyException as e:
             if "No active device" in str(e):
                 return "No active device. Open Spotify app first!"
             return f"Error: {str(e)}"
 
+    @debounce(0.3)
     def pause(self) -> str:
         """Pause playback."""
         try:
@@ -70,6 +136,7 @@ class SpotifyPlayer:
         except Exception as e:
             return f"Error: {str(e)}"
 
+    @debounce(0.3)
     def next_track(self) -> str:
         """Skip to next track."""
         try:
@@ -78,6 +145,7 @@ class SpotifyPlayer:
         except Exception as e:
             return f"Error: {str(e)}"
 
+    @debounce(0.3)
     def previous_track(self) -> str:
         """Go to previous track."""
         try:
@@ -88,28 +156,57 @@ class SpotifyPlayer:
 
     def set_volume(self, volume: int) -> str:
         """Set volume (0-100)."""
+        volume = max(0, min(100, volume))
         try:
-            self.sp.volume(max(0, min(100, volume)))
+            self.sp.volume(volume)
             return f"Volume: {volume}%"
         except Exception as e:
             return f"Error: {str(e)}"
 
+    # Cached helpers raise on failure so errors are never cached, and return
+    # tuples that the public methods copy, so callers can't alter the cache
+
+    @cache(ttl=1800, key_prefix="search", method=True)
+    def _search(self, query: str, limit: int) -> Tuple[Dict, ...]:
+        results = self.sp.search(q=query, type="track", limit=limit)
+        return tuple(
+            {"name": item["name"], "artists": ", ".join(a["name"] for a in item["artists"]), "uri": item["uri"]}
+            for item in results["tracks"]["items"]
+        )
+
+    @cache(ttl=300, key_prefix="rec", method=True)
+    def _recommendations(self, mood: Optional[str], limit: int) -> Tuple[Dict, ...]:
+        seed_tracks = list(self._top_tracks()[:2])
+
+        params = {"limit": limit}
+        if seed_tracks:
+            params["seed_tracks"] = seed_tracks
+
+        if mood:
+            mood_params = get_mood_features(mood)
+            # Only pass target_ params to Spotify API
+            for key, value in mood_params.items():
+                if key.startswith("target_"):
+                    params[key] = value
+
+        results = self.sp.recommendations(**params)
+        return tuple(
+            {"name": t["name"], "artists": ", ".join(a["name"] for a in t["artists"]), "uri": t["uri"]}
+            for t in results["tracks"]
+        )
+
     def search(self, query: str, limit: int = 5) -> List[Dict]:
         """Search for tracks."""
         try:
-            results = self.sp.search(q=query, type="track", limit=limit)
-            tracks = []
-            for item in results["tracks"]["items"]:
-                tracks.append({
-                    "name": item["name"],
-                    "artists": ", ".join(a["name"] for a in item["artists"]),
-                    "uri": item["uri"],
-                })
-            return tracks
+            return [dict(t) for t in self._search(query, limit)]
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
 
+    def batch_search(self, queries: List[str], limit: int = 5) -> List[List[Dict]]:
+        """Search several queries concurrently. Results are in query order."""
+        return list(self._pool.map(lambda q: self.search(q, limit), queries))
+
     def search_and_play(self, query: str) -> str:
         """Search for a track and play it."""
         tracks = self.search(query, limit=1)
@@ -129,28 +226,25 @@ class SpotifyPlayer:
                 return f"Error: {str(e)}"
         return f"No results for '{query}'"
 
+    def add_many_to_queue(self, queries: List[str]) -> str:
+        """Search all queries concurrently, then queue the top hits in order."""
+        queued = []
+        for query, tracks in zip(queries, self.batch_search(queries, limit=1)):
+            if not tracks:
+                continue
+            try:
+                self.sp.add_to_queue(tracks[0]["uri"])
+                queued.append(tracks[0]["name"])
+            except Exception as e:
+                logger.error(f"Queueing '{query}' failed: {e}")
+        if not queued:
+            return "Nothing added to queue"
+        return f"Added to queue: {', '.join(queued)}"
+
     def get_recommendations(self, mood: Optional[str] = None, limit: int = 5) -> List[Dict]:
         """Get recommendations based on mood or top tracks."""
         try:
-            top = self.sp.current_user_top_tracks(limit=5, time_range="short_term")
-            seed_tracks = [t["id"] for t in top["items"][:2]] if top["items"] else []
-
-            params = {"limit": limit}
-            if seed_tracks:
-                params["seed_tracks"] = seed_tracks
-
-            if mood:
-                mood_params = get_mood_features(mood)
-                # Only pass target_ params to Spotify API
-                for key, value in mood_params.items():
-                    if key.startswith("target_"):
-                        params[key] = value
-
-            results = self.sp.recommendations(**params)
-            return [
-                {"name": t["name"], "artists": ", ".join(a["name"] for a in t["artists"]), "uri": t["uri"]}
-                for t in results["tracks"]
-            ]
+            return [dict(t) for t in self._recommendations(mood, limit)]
         except Exception as e:
             logger.error(f"Recommendations failed: {e}")
             return []
@@ -162,13 +256,14 @@ class SpotifyPlayer:
             if not tracks:
                 return "Couldn't generate tracks"
 
-            user = self.sp.current_user()
             playlist = self.sp.user_playlist_create(
-                user["id"], name,
+                self.user_id, name,
                 description=f"Created by AMP AI - {mood or 'personalized'} vibes"
             )
 
-            self.sp.playlist_add_items(playlist["id"], [t["uri"] for t in tracks])
+            uris = [t["uri"] for t in tracks]
+            for i in range(0, len(uris), PLAYLIST_ADD_LIMIT):
+                self.sp.playlist_add_items(playlist["id"], uris[i:i + PLAYLIST_ADD_LIMIT])
             return f"Created '{name}' with {len(tracks)} tracks!"
         except Exception as e:
             return f"Error: {str(e)}"
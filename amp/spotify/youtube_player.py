@@ -1,12 +1,10 @@
 """YouTube Music player service for AMP."""
 
-from typing import Optional, List, Dict
-import webbrowser
-
-from ytmusicapi import YTMusic
+from typing import Optional, List, Dict, Tuple
 
 from amp.utils.logger import get_logger
 from amp.utils.audio_utils import get_mood_features
+from amp.utils.cache_manager import cache
 
 logger = get_logger("youtube")
 
@@ -15,6 +13,9 @@ class YouTubePlayer:
     """Handles all YouTube Music interactions."""
 
     def __init__(self):
+        # Imported here so startup doesn't pay for ytmusicapi unless YouTube is used
+        from ytmusicapi import YTMusic
+
         # YTMusic doesn't require auth for basic searches and playback control
         # For authenticated features (library, playlists), you'd need to set up oauth.txt
         self.yt = YTMusic()
@@ -38,6 +39,8 @@ class YouTubePlayer:
 
     def play(self, uri: Optional[str] = None) -> str:
         """Play music. If URI/video_id provided, play that track."""
+        import webbrowser
+
         try:
             if uri:
                 video_id = uri.split("v=")[-1] if "v=" in uri else uri
@@ -65,18 +68,23 @@ class YouTubePlayer:
         """Set volume (browser-based, manual)."""
         return f"Set volume to {volume}% in your YouTube Music browser tab"
 
+    # Raises on failure so errors are never cached; returns a tuple the callers copy
+    @cache(ttl=1800, key_prefix="yt_search", method=True)
+    def _search_songs(self, query: str, limit: int) -> Tuple[Dict, ...]:
+        results = self.yt.search(query, filter="songs", limit=limit)
+        return tuple(
+            {
+                "name": item.get("title", "Unknown"),
+                "artists": ", ".join([a["name"] for a in item.get("artists", [])]),
+                "uri": item.get("videoId", ""),
+            }
+            for item in results
+        )
+
     def search(self, query: str, limit: int = 5) -> List[Dict]:
         """Search for tracks."""
         try:
-            results = self.yt.search(query, filter="songs", limit=limit)
-            tracks = []
-            for item in results:
-                tracks.append({
-                    "name": item.get("title", "Unknown"),
-                    "artists": ", ".join([a["name"] for a in item.get("artists", [])]),
-                    "uri": item.get("videoId", ""),
-                })
-            return tracks
+            return [dict(t) for t in self._search_songs(query, limit)]
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
@@ -102,16 +110,7 @@ class YouTubePlayer:
         try:
             # Use mood-based search queries
             query = f"{mood} music" if mood else "popular music"
-            results = self.yt.search(query, filter="songs", limit=limit)
-
-            tracks = []
-            for item in results:
-                tracks.append({
-                    "name": item.get("title", "Unknown"),
-                    "artists": ", ".join([a["name"] for a in item.get("artists", [])]),
-                    "uri": item.get("videoId", ""),
-                })
-            return tracks
+            return [dict(t) for t in self._search_songs(query, limit)]
         except Exception as e:
             logger.error(f"Recommendations failed: {e}")
             return []
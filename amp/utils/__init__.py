@@ -2,7 +2,9 @@
 
 from .logger import get_logger, setup_logging
 from .cache_manager import CacheManager, cache
-from .retry_handler import retry, RetryConfig
+from .semantic_cache import SemanticCache
+from .retry_handler import retry, async_retry, RetryConfig
+from .rate_limiter import TokenBucket
 from .audio_utils import AudioFeatures, MOOD_FEATURES, get_mood_features, format_duration, format_progress_bar
 
 __all__ = [
@@ -10,8 +12,11 @@ __all__ = [
     "setup_logging",
     "CacheManager",
     "cache",
+    "SemanticCache",
     "retry",
+    "async_retry",
     "RetryConfig",
+    "TokenBucket",
     "AudioFeatures",
     "MOOD_FEATURES",
     "get_mood_features",
@@ -1,10 +1,11 @@
 """Audio utilities for AMP."""
 
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioFeatures:
     """Spotify audio features for a track."""
     danceability: float = 0.0
@@ -22,19 +23,19 @@ class AudioFeatures:
 
     @classmethod
     def from_spotify_dict(cls, data: dict) -> "AudioFeatures":
-        return cls(
-            danceability=data.get("danceability", 0.0),
-            energy=data.get("energy", 0.0),
-            valence=data.get("valence", 0.0),
-            tempo=data.get("tempo", 0.0),
-            instrumentalness=data.get("instrumentalness", 0.0),
-            acousticness=data.get("acousticness", 0.0),
-            speechiness=data.get("speechiness", 0.0),
-            liveness=data.get("liveness", 0.0),
-            loudness=data.get("loudness", 0.0),
-            key=data.get("key", 0),
-            mode=data.get("mode", 0),
-            time_signature=data.get("time_signature", 4),
+        get = data.get
+        return cls(*[get(name, default) for name, default in _FIELDS])
+
+    def to_vector(self) -> tuple:
+        """Similarity features in SIMILARITY_WEIGHTS order, tempo normalised."""
+        return (
+            self.energy,
+            self.valence,
+            self.danceability,
+            self.instrumentalness,
+            self.acousticness,
+            (self.tempo - 60) / 140,
+            self.speechiness,
         )
 
     def to_dict(self) -> dict:
@@ -54,6 +55,10 @@ class AudioFeatures:
         }
 
 
+# (field, default) in declaration order, so values can be passed positionally
+_FIELDS = tuple((f.name, f.default) for f in fields(AudioFeatures))
+
+
 MOOD_FEATURES: Dict[str, Dict[str, float]] = {
     "happy": {"target_valence": 0.8, "target_energy": 0.7, "min_valence": 0.6},
     "sad": {"target_valence": 0.2, "target_energy": 0.3, "max_valence": 0.4},
@@ -69,6 +74,7 @@ MOOD_FEATURES: Dict[str, Dict[str, float]] = {
 }
 
 
+@lru_cache(maxsize=32)
 def get_mood_features(mood: str) -> Dict[str, float]:
     """Get Spotify recommendation parameters for a mood."""
     return MOOD_FEATURES.get(mood.lower(), {})
@@ -94,50 +100,76 @@ def analyze_mood_from_features(features: AudioFeatures) -> str:
         return "neutral"
 
 
+# (whole seconds, formatted) of the last call; UI refreshes repeat the same second
+_last_duration: tuple = (None, "")
+
+
 def format_duration(ms: int) -> str:
     """Format milliseconds as mm:ss or hh:mm:ss."""
+    global _last_duration
     total_seconds = ms // 1000
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    cached_seconds, cached = _last_duration
+    if total_seconds == cached_seconds:
+        return cached
+
+    minutes, seconds = divmod(total_seconds, 60)
+    if minutes >= 60:
+        hours, minutes = divmod(minutes, 60)
+        text = f"{hours}:{minutes:02d}:{seconds:02d}"
+    else:
+        text = f"{minutes}:{seconds:02d}"
+    _last_duration = (total_seconds, text)
+    return text
+
 
-    if hours > 0:
-        return f"{hours}:{minutes:02d}:{seconds:02d}"
-    return f"{minutes}:{seconds:02d}"
+# Longest bar served by slicing; wider bars fall back to repetition
+_BAR_MAX = 120
+_BAR_FULL = "━" * _BAR_MAX
+_BAR_REST = "─" * _BAR_MAX
 
 
 def format_progress_bar(progress: float, width: int = 30) -> str:
     """Create a progress bar string."""
     filled = int(progress * width)
     filled = max(0, min(width - 1, filled))
-    bar = "━" * filled + "○" + "─" * (width - filled - 1)
-    return f"[{bar}]"
+    rest = width - filled - 1
+    if width <= _BAR_MAX:
+        return f"[{_BAR_FULL[:filled]}○{_BAR_REST[:rest]}]"
+    return f"[{'━' * filled}○{'─' * rest}]"
+
+
+# Weights for energy, valence, danceability, instrumentalness, acousticness,
+# tempo, speechiness (the AudioFeatures.to_vector order)
+SIMILARITY_WEIGHTS = (0.2, 0.2, 0.15, 0.15, 0.1, 0.1, 0.1)
 
 
 def calculate_similarity(features1: AudioFeatures, features2: AudioFeatures) -> float:
     """Calculate similarity score between two tracks (0-1)."""
-    weights = {
-        "energy": 0.2, "valence": 0.2, "danceability": 0.15,
-        "instrumentalness": 0.15, "acousticness": 0.1, "tempo": 0.1, "speechiness": 0.1,
-    }
+    return sum(
+        w * (1 - abs(a - b))
+        for w, a, b in zip(SIMILARITY_WEIGHTS, features1.to_vector(), features2.to_vector())
+    )
+
+
+def calculate_similarity_batch(seed: AudioFeatures, candidates: List[AudioFeatures]) -> List[float]:
+    """Similarity of every candidate to seed, in one vectorised pass. Requires numpy."""
+    import numpy as np
+
+    if not candidates:
+        return []
+    matrix = np.array([c.to_vector() for c in candidates], dtype=np.float64)
+    seed_vec = np.array(seed.to_vector(), dtype=np.float64)
+    weights = np.array(SIMILARITY_WEIGHTS, dtype=np.float64)
+    return ((1 - np.abs(matrix - seed_vec)) @ weights).tolist()
 
-    score = 0.0
-    for attr, weight in weights.items():
-        val1 = getattr(features1, attr)
-        val2 = getattr(features2, attr)
-        if attr == "tempo":
-            val1 = (val1 - 60) / 140
-            val2 = (val2 - 60) / 140
-        diff = abs(val1 - val2)
-        score += weight * (1 - diff)
 
-    return score
+KEY_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
 
 
+@lru_cache(maxsize=32)
 def get_key_name(key: int, mode: int) -> str:
     """Get musical key name from Spotify key/mode values."""
-    keys = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
     mode_name = "major" if mode == 1 else "minor"
     if 0 <= key < 12:
-        return f"{keys[key]} {mode_name}"
+        return f"{KEY_NAMES[key]} {mode_name}"
     return "Unknown"
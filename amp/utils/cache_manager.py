@@ -1,8 +1,9 @@
 """Cache management utilities for AMP."""
 
+import heapq
 import time
-import hashlib
-from typing import Any, Optional, Dict, Callable
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Callable, List, Tuple
 from dataclasses import dataclass, field
 from functools import wraps
 from threading import Lock
@@ -21,10 +22,13 @@ class CacheEntry:
 
 
 class CacheManager:
-    """Thread-safe in-memory cache with TTL support."""
+    """Thread-safe in-memory cache with TTL support and LRU eviction."""
 
     def __init__(self, default_ttl: int = 300, max_size: int = 1000):
-        self._cache: Dict[str, CacheEntry] = {}
+        # Ordered least- to most-recently used
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # (expires_at, key) min-heap; entries for replaced/removed keys are skipped lazily
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._lock = Lock()
         self._default_ttl = default_ttl
         self._max_size = max_size
@@ -43,16 +47,22 @@ class CacheManager:
                 self._misses += 1
                 return None
 
+            self._cache.move_to_end(key)
             entry.hits += 1
             self._hits += 1
             return entry.value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         with self._lock:
-            if len(self._cache) >= self._max_size:
-                self._evict_oldest()
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self._max_size:
+                self._cache.popitem(last=False)
             expires_at = time.time() + (ttl or self._default_ttl)
             self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            if len(self._expiry_heap) > 2 * self._max_size:
+                self._rebuild_heap()
 
     def delete(self, key: str) -> bool:
         with self._lock:
@@ -64,20 +74,26 @@ class CacheManager:
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
 
     def clear_expired(self) -> int:
         with self._lock:
             now = time.time()
-            expired = [k for k, v in self._cache.items() if now > v.expires_at]
-            for key in expired:
-                del self._cache[key]
-            return len(expired)
-
-    def _evict_oldest(self) -> None:
-        entries = sorted(self._cache.items(), key=lambda x: x[1].expires_at)
-        evict_count = max(1, len(entries) // 10)
-        for key, _ in entries[:evict_count]:
-            del self._cache[key]
+            heap = self._expiry_heap
+            removed = 0
+            while heap and heap[0][0] < now:
+                expires_at, key = heapq.heappop(heap)
+                entry = self._cache.get(key)
+                # Skip stale heap entries whose key was since re-set or removed
+                if entry is not None and entry.expires_at == expires_at:
+                    del self._cache[key]
+                    removed += 1
+            return removed
+
+    def _rebuild_heap(self) -> None:
+        """Drop stale heap entries once they outnumber the live ones."""
+        self._expiry_heap = [(entry.expires_at, key) for key, entry in self._cache.items()]
+        heapq.heapify(self._expiry_heap)
 
     @property
     def stats(self) -> Dict[str, Any]:
@@ -102,15 +118,26 @@ def get_cache() -> CacheManager:
     return _global_cache
 
 
-def cache(ttl: Optional[int] = None, key_prefix: str = ""):
-    """Decorator to cache function results."""
+def cache(ttl: Optional[int] = None, key_prefix: str = "", method: bool = False):
+    """Decorator to cache function results.
+
+    With method=True the first argument (self) is left out of the key, so
+    use it only on methods of a client that exists once per process. The
+    cached value itself is returned, so cache immutable results (tuples).
+    """
     def decorator(func: Callable) -> Callable:
+        prefix = f"{key_prefix}:{func.__name__}"
+        skip = 1 if method else 0
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            key_parts = [key_prefix, func.__name__]
-            key_parts.extend(str(arg) for arg in args)
-            key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-            cache_key = hashlib.md5(":".join(key_parts).encode()).hexdigest()
+            # The joined string is the key; the dict hashes it natively.
+            # kwargs keep call-site order: reordering them only costs a miss.
+            key_parts = [prefix]
+            key_parts.extend(str(arg) for arg in args[skip:])
+            if kwargs:
+                key_parts.extend(f"{k}={v}" for k, v in kwargs.items())
+            cache_key = ":".join(key_parts)
 
             cache_instance = get_cache()
             result = cache_instance.get(cache_key)
@@ -0,0 +1,40 @@
+"""Fast JSON serialization for AMP (orjson with a stdlib fallback)."""
+
+import dataclasses
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types orjson handles natively when falling back to stdlib json."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Serialize obj to a JSON string."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, default=_default, sort_keys=sort_keys, separators=(",", ":"))
+
+
+def loads(data: Any) -> Any:
+    """Deserialize JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
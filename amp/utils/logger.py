@@ -2,12 +2,29 @@
 
 import logging
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
 
 
-class AMPFormatter(logging.Formatter):
+class _TimestampCache:
+    """Formats record timestamps once per wall-clock second."""
+
+    TIME_FORMAT = '%H:%M:%S'
+
+    _last: tuple = (None, '')
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        cached_second, cached = self._last
+        if second != cached_second:
+            cached = time.strftime(self.TIME_FORMAT, time.localtime(second))
+            self._last = (second, cached)
+        return cached
+
+
+class AMPFormatter(_TimestampCache, logging.Formatter):
     """Custom formatter with colors for terminal output."""
 
     COLORS = {
@@ -21,41 +38,36 @@ class AMPFormatter(logging.Formatter):
 
     def __init__(self, use_colors: bool = True):
         super().__init__()
-        self.use_colors = use_colors
+        # Checked once; the console handler's stream doesn't change
+        self.use_colors = use_colors and sys.stdout.isatty()
 
     def format(self, record: logging.LogRecord) -> str:
-        timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
+        timestamp = self._timestamp(record)
         level = record.levelname
         name = record.name.split('.')[-1]
         message = record.getMessage()
 
-        if self.use_colors and sys.stdout.isatty():
+        if self.use_colors:
             color = self.COLORS.get(level, '')
             return f"{color}[{timestamp}] {level:8s}{self.RESET} [{name}] {message}"
         else:
             return f"[{timestamp}] {level:8s} [{name}] {message}"
 
 
-class FileFormatter(logging.Formatter):
+class FileFormatter(_TimestampCache, logging.Formatter):
     """Formatter for file output."""
 
+    TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
     def format(self, record: logging.LogRecord) -> str:
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self._timestamp(record)
         return f"[{timestamp}] {record.levelname:8s} [{record.name}] {record.getMessage()}"
 
 
-_loggers: dict = {}
-
-
+@lru_cache(maxsize=64)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for the given name."""
-    full_name = f"amp.{name}" if not name.startswith("amp.") else name
-
-    if full_name not in _loggers:
-        logger = logging.getLogger(full_name)
-        _loggers[full_name] = logger
-
-    return _loggers[full_name]
+    return logging.getLogger(name if name.startswith("amp.") else f"amp.{name}")
 
 
 def setup_logging(
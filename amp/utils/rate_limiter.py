@@ -0,0 +1,74 @@
+"""Client-side rate limiting utilities for AMP."""
+
+import threading
+import time
+from typing import Any
+
+from .logger import get_logger
+
+logger = get_logger("rate_limiter")
+
+
+class TokenBucket:
+    """Thread-safe token bucket: bursts up to capacity, then refill_rate tokens/second."""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available right now; never blocks."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until tokens are available, then take them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.refill_rate
+            time.sleep(wait)
+
+    def __enter__(self) -> "TokenBucket":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+class RateLimitedClient:
+    """Proxy that takes one token from bucket before every method call on client."""
+
+    def __init__(self, client: Any, bucket: TokenBucket):
+        self._client = client
+        self._bucket = bucket
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        bucket = self._bucket
+
+        def call(*args, **kwargs):
+            with bucket:
+                return attr(*args, **kwargs)
+
+        call.__name__ = name
+        return call
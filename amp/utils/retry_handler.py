@@ -1,13 +1,52 @@
 """Retry handling utilities for AMP."""
 
+import asyncio
 import time
 import random
-from typing import Callable, Optional, Tuple, Type, Any
-from functools import wraps
-from dataclasses import dataclass
+import threading
+import weakref
+from typing import Callable, Optional, Tuple, Type, Any, Union
+from functools import wraps, lru_cache
+from dataclasses import dataclass, field
 
 from .logger import get_logger
 
+ExceptionTypes = Tuple[Type[Exception], ...]
+# A tuple of exception types, or a function returning one (resolved on first call)
+ExceptionSpec = Union[ExceptionTypes, Callable[[], ExceptionTypes]]
+
+
+# spotipy and requests are imported on first use, not when amp.utils loads
+
+@lru_cache(maxsize=None)
+def spotify_exceptions() -> ExceptionTypes:
+    try:
+        from spotipy.exceptions import SpotifyException
+    except ImportError:
+        return (Exception,)
+    return (SpotifyException,)
+
+
+@lru_cache(maxsize=None)
+def default_retry_exceptions() -> ExceptionTypes:
+    """Network and API failures that may clear up on their own."""
+    found: list = [ConnectionError, TimeoutError]
+    try:
+        from requests.exceptions import RequestException
+        found.append(RequestException)
+    except ImportError:
+        pass
+    found.extend(e for e in spotify_exceptions() if e is not Exception)
+    return tuple(found)
+
+
+def _resolve(exceptions: ExceptionSpec) -> ExceptionTypes:
+    return exceptions if isinstance(exceptions, tuple) else exceptions()
+
+# Never retried, even when caught: programming errors and client errors won't self-heal
+NON_RETRYABLE_EXCEPTIONS = (TypeError, ValueError, AttributeError)
+NON_RETRYABLE_STATUS = frozenset({400, 401, 403, 404})
+
 logger = get_logger("retry")
 
 
@@ -19,7 +58,14 @@ class RetryConfig:
     max_delay: float = 30.0
     exponential_base: float = 2.0
     jitter: bool = True
-    exceptions: Tuple[Type[Exception], ...] = (Exception,)
+    exceptions: ExceptionTypes = field(default_factory=default_retry_exceptions)
+
+
+def is_retryable(exception: Exception) -> bool:
+    """False for errors another attempt cannot fix."""
+    if isinstance(exception, NON_RETRYABLE_EXCEPTIONS):
+        return False
+    return getattr(exception, "http_status", None) not in NON_RETRYABLE_STATUS
 
 
 def calculate_delay(
@@ -37,32 +83,54 @@ def calculate_delay(
     return delay
 
 
+def retry_after_delay(exception: Exception, max_delay: float) -> Optional[float]:
+    """Seconds the server asked us to wait on a 429 (Retry-After), or None."""
+    if getattr(exception, "http_status", None) != 429:
+        return None
+    headers = getattr(exception, "headers", None) or {}
+    value = headers.get("Retry-After", headers.get("retry-after"))
+    try:
+        return min(float(value), max_delay)
+    except (TypeError, ValueError):
+        return None
+
+
 def retry(
     max_attempts: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 30.0,
     exponential_base: float = 2.0,
     jitter: bool = True,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    exceptions: ExceptionSpec = default_retry_exceptions,
     on_retry: Optional[Callable[[Exception, int], None]] = None,
 ):
-    """Decorator for retrying functions with exponential backoff."""
+    """Decorator for retrying functions with exponential backoff.
+
+    A 429 carrying a Retry-After header waits exactly that long (capped at
+    max_delay) instead of the backoff delay.
+    """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             last_exception = None
+            catch = _resolve(exceptions)
 
             for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
-                except exceptions as e:
+                except catch as e:
                     last_exception = e
 
+                    if not is_retryable(e):
+                        raise
+
                     if attempt == max_attempts:
                         logger.error(f"{func.__name__} failed after {max_attempts} attempts: {e}")
                         raise
 
-                    delay = calculate_delay(attempt, base_delay, max_delay, exponential_base, jitter)
+                    delay = retry_after_delay(e, max_delay)
+                    if delay is None:
+                        delay = calculate_delay(attempt, base_delay, max_delay, exponential_base, jitter)
                     logger.warning(
                         f"{func.__name__} attempt {attempt}/{max_attempts} failed: {e}. "
                         f"Retrying in {delay:.2f}s"
@@ -80,6 +148,49 @@ def retry(
     return decorator
 
 
+def async_retry(
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    exponential_base: float = 2.0,
+    jitter: bool = True,
+    exceptions: ExceptionSpec = default_retry_exceptions,
+    on_retry: Optional[Callable[[Exception, int], None]] = None,
+):
+    """retry() for coroutine functions; backoff awaits instead of blocking the thread."""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            catch = _resolve(exceptions)
+
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except catch as e:
+                    if not is_retryable(e):
+                        raise
+
+                    if attempt == max_attempts:
+                        logger.error(f"{func.__name__} failed after {max_attempts} attempts: {e}")
+                        raise
+
+                    delay = retry_after_delay(e, max_delay)
+                    if delay is None:
+                        delay = calculate_delay(attempt, base_delay, max_delay, exponential_base, jitter)
+                    logger.warning(
+                        f"{func.__name__} attempt {attempt}/{max_attempts} failed: {e}. "
+                        f"Retrying in {delay:.2f}s"
+                    )
+
+                    if on_retry:
+                        on_retry(e, attempt)
+
+                    await asyncio.sleep(delay)
+
+        return wrapper
+    return decorator
+
+
 class RetryContext:
     """Context manager for retry logic."""
 
@@ -92,30 +203,102 @@ class RetryContext:
         return self
 
     def __next__(self) -> int:
+        delay = self._next_delay()
+        if delay:
+            time.sleep(delay)
+        self.attempt += 1
+        return self.attempt
+
+    def _next_delay(self) -> float:
+        """Seconds to wait before the next attempt; raises when attempts are exhausted."""
+        if self.last_exception and not is_retryable(self.last_exception):
+            raise self.last_exception
         if self.attempt >= self.config.max_attempts:
             if self.last_exception:
                 raise self.last_exception
             raise StopIteration
 
         if self.attempt > 0 and self.last_exception:
-            delay = calculate_delay(
-                self.attempt,
-                self.config.base_delay,
-                self.config.max_delay,
-                self.config.exponential_base,
-                self.config.jitter,
-            )
-            time.sleep(delay)
-
-        self.attempt += 1
-        return self.attempt
+            delay = retry_after_delay(self.last_exception, self.config.max_delay)
+            if delay is None:
+                delay = calculate_delay(
+                    self.attempt,
+                    self.config.base_delay,
+                    self.config.max_delay,
+                    self.config.exponential_base,
+                    self.config.jitter,
+                )
+            return delay
+        return 0.0
 
     def record_failure(self, exception: Exception) -> None:
         self.last_exception = exception
 
     def success(self) -> None:
         self.attempt = self.config.max_attempts
+        self.last_exception = None
+
+
+class AsyncRetryContext(RetryContext):
+    """RetryContext for ``async for``; the backoff yields to the event loop."""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> int:
+        try:
+            delay = self._next_delay()
+        except StopIteration:
+            raise StopAsyncIteration
+        if delay:
+            await asyncio.sleep(delay)
+        self.attempt += 1
+        return self.attempt
+
+
+def debounce(interval: float = 0.3):
+    """Decorator for methods: calls within interval of the last real call are dropped.
+
+    A dropped call returns the previous call's result. Failures (an exception
+    or an "Error: ..." string) release the slot so a retry runs at once.
+    State is per instance.
+    """
+    def decorator(func: Callable) -> Callable:
+        last: "weakref.WeakKeyDictionary[Any, Tuple[float, Any]]" = weakref.WeakKeyDictionary()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs) -> Any:
+            now = time.monotonic()
+            with lock:
+                previous = last.get(self)
+                if previous is not None and now - previous[0] < interval:
+                    return previous[1]
+                # Claim the slot before calling so concurrent callers are dropped too
+                last[self] = (now, previous[1] if previous else None)
+            try:
+                result = func(self, *args, **kwargs)
+            except Exception:
+                _release(self, previous)
+                raise
+            if isinstance(result, str) and result.startswith("Error:"):
+                _release(self, previous)
+            else:
+                with lock:
+                    last[self] = (now, result)
+            return result
+
+        def _release(instance, previous) -> None:
+            with lock:
+                if previous is None:
+                    last.pop(instance, None)
+                else:
+                    last[instance] = previous
+
+        return wrapper
+    return decorator
 
 
-spotify_retry = retry(max_attempts=3, base_delay=1.0, exceptions=(Exception,))
+# Spotify rate limits with 429 + Retry-After, which retry() honours
+spotify_retry = retry(max_attempts=3, base_delay=1.0, exceptions=spotify_exceptions)
 llm_retry = retry(max_attempts=2, base_delay=2.0, max_delay=10.0, exceptions=(Exception,))
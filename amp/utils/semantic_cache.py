@@ -0,0 +1,97 @@
+"""Semantic command cache for AMP."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .logger import get_logger
+
+logger = get_logger("semantic_cache")
+
+
+class SemanticCache:
+    """Embedding-based cache mapping user phrasings to previous tool calls.
+
+    Requires the optional ``sentence-transformers`` package. When it is not
+    installed the cache disables itself and every lookup misses.
+    """
+
+    MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+    def __init__(self, threshold: float = 0.93, max_entries: int = 512):
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._model = None
+        self._available = True
+        self._np = None
+
+        # Row i of _matrix is the embedding for _entries[i]
+        self._matrix = None
+        self._entries: List[Tuple[str, Dict[str, Any], str]] = []
+        self._last_used: List[int] = []
+        self._tick = 0
+
+    def _load_model(self) -> bool:
+        if self._model is not None:
+            return True
+        if not self._available:
+            return False
+        try:
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.info("sentence-transformers not installed, semantic cache disabled")
+            self._available = False
+            return False
+
+        self._np = np
+        self._model = SentenceTransformer(self.MODEL_NAME)
+        return True
+
+    def embed(self, text: str) -> Optional[Any]:
+        """Return the normalized embedding for text, or None if unavailable."""
+        if not self._load_model():
+            return None
+        try:
+            return self._model.encode(text.strip().lower(), normalize_embeddings=True)
+        except Exception as e:
+            logger.warning("Embedding failed: %s", e)
+            return None
+
+    def lookup(self, embedding: Any) -> Optional[Tuple[str, Dict[str, Any], str]]:
+        """Return (fn_name, fn_args, response) for the closest match above threshold."""
+        if embedding is None or not self._entries:
+            return None
+
+        scores = self._matrix[:len(self._entries)] @ embedding
+        best = int(scores.argmax())
+        if scores[best] < self._threshold:
+            return None
+
+        self._tick += 1
+        self._last_used[best] = self._tick
+        return self._entries[best]
+
+    def store(self, embedding: Any, fn_name: str, fn_args: Dict[str, Any], response: str) -> None:
+        """Remember a resolved tool call, evicting the least recently used entry when full."""
+        if embedding is None:
+            return
+
+        np = self._np
+        if self._matrix is None:
+            self._matrix = np.empty((self._max_entries, embedding.shape[0]), dtype=np.float32)
+
+        self._tick += 1
+        if len(self._entries) < self._max_entries:
+            slot = len(self._entries)
+            self._entries.append((fn_name, fn_args, response))
+            self._last_used.append(self._tick)
+        else:
+            slot = min(range(len(self._last_used)), key=self._last_used.__getitem__)
+            self._entries[slot] = (fn_name, fn_args, response)
+            self._last_used[slot] = self._tick
+
+        self._matrix[slot] = embedding
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._last_used.clear()
+        self._tick = 0
@@ -0,0 +1,55 @@
+"""Tests for amp.models.action_result."""
+
+from amp.models import ActionResult
+from amp.models.action_result import LLM_ITEMS, MAX_ITEMS
+
+
+def test_items_are_capped_and_total_is_kept():
+    result = ActionResult.success("Found", items=list(range(MAX_ITEMS + 50)))
+
+    assert len(result.items) == MAX_ITEMS
+    assert result.total_items == MAX_ITEMS + 50
+
+
+def test_explicit_total_items_is_not_overwritten():
+    result = ActionResult.success("Found", items=list(range(MAX_ITEMS + 1)), total_items=5000)
+
+    assert len(result.items) == MAX_ITEMS
+    assert result.total_items == 5000
+
+
+def test_small_item_lists_are_left_alone():
+    result = ActionResult.success("Found", items=[1, 2, 3])
+    assert result.items == [1, 2, 3]
+    assert result.total_items == 0
+
+
+def test_llm_response_without_items_is_the_message():
+    assert ActionResult.success("Paused").to_llm_response() == "Paused"
+
+
+def test_llm_response_lists_items():
+    response = ActionResult.success("Found", items=["a", "b"]).to_llm_response()
+    assert response == "Found\n  - a\n  - b"
+
+
+def test_llm_response_shows_only_the_first_items():
+    result = ActionResult.success("Found", items=[f"song {i}" for i in range(LLM_ITEMS + 5)])
+    lines = result.to_llm_response().split("\n")
+
+    assert lines[0] == "Found"
+    assert lines[1:LLM_ITEMS + 1] == [f"  - song {i}" for i in range(LLM_ITEMS)]
+    assert lines[-1] == "  ... and 5 more"
+
+
+def test_llm_response_counts_items_dropped_by_the_cap():
+    result = ActionResult.success("Found", items=list(range(MAX_ITEMS + 50)))
+    assert result.to_llm_response().endswith(f"  ... and {MAX_ITEMS + 50 - LLM_ITEMS} more")
+
+
+def test_llm_response_for_failures():
+    assert ActionResult.failure("No device").to_llm_response() == "Error: No device"
+    assert (
+        ActionResult.failure("No device", error_details="403").to_llm_response()
+        == "Error: No device (403)"
+    )
@@ -0,0 +1,85 @@
+"""Tests for amp.utils.cache_manager."""
+
+import pytest
+
+from amp.utils import cache_manager
+from amp.utils.cache_manager import CacheManager
+
+
+class _Clock:
+    """Replaces the time module in cache_manager so expiry can be stepped."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(cache_manager, "time", fake)
+    return fake
+
+
+def test_full_cache_evicts_the_least_recently_used_entry():
+    cache = CacheManager(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_overwriting_a_key_does_not_evict():
+    cache = CacheManager(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") == 2
+    assert cache.stats["size"] == 2
+
+
+def test_get_misses_after_ttl(clock):
+    cache = CacheManager()
+    cache.set("a", 1, ttl=10)
+    clock.now += 5
+    assert cache.get("a") == 1
+    clock.now += 10
+    assert cache.get("a") is None
+
+
+def test_clear_expired_removes_only_expired_entries(clock):
+    cache = CacheManager()
+    cache.set("short", 1, ttl=10)
+    cache.set("long", 2, ttl=100)
+    clock.now += 50
+
+    assert cache.clear_expired() == 1
+    assert cache.get("long") == 2
+    assert cache.stats["size"] == 1
+
+
+def test_clear_expired_skips_keys_that_were_set_again(clock):
+    cache = CacheManager()
+    cache.set("a", 1, ttl=10)
+    cache.set("a", 2, ttl=100)  # leaves a stale heap entry for the first expiry
+    clock.now += 50
+
+    assert cache.clear_expired() == 0
+    assert cache.get("a") == 2
+
+
+def test_expiry_heap_stays_bounded(clock):
+    cache = CacheManager(max_size=4)
+    for i in range(100):
+        cache.set("a", i, ttl=10)
+    assert len(cache._expiry_heap) <= 2 * 4 + 1
+    assert cache.get("a") == 99
@@ -0,0 +1,86 @@
+"""Tests for the TOML cache in amp.config.amp_config."""
+
+import os
+
+import pytest
+
+from amp.config import amp_config
+from amp.config.amp_config import AMPConfig
+from amp.utils.json_utils import dumps, loads
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "config.json"
+    monkeypatch.setattr(amp_config, "CONFIG_CACHE_PATH", path)
+    monkeypatch.delenv("AMP_DEBUG", raising=False)
+    monkeypatch.delenv("AMP_LOG_LEVEL", raising=False)
+    return path
+
+
+def _write_toml(path, log_level, mtime_ns):
+    path.write_text(f'[app]\nlog_level = "{log_level}"\n')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_first_load_writes_the_cache(tmp_path, cache_path):
+    toml = tmp_path / "amp.toml"
+    _write_toml(toml, "DEBUG", 1_000_000_000)
+
+    assert AMPConfig.load(str(toml)).log_level == "DEBUG"
+    assert loads(cache_path.read_bytes())["data"] == {"app": {"log_level": "DEBUG"}}
+
+
+def test_unchanged_file_is_served_from_the_cache(tmp_path, cache_path):
+    toml = tmp_path / "amp.toml"
+    _write_toml(toml, "DEBUG", 1_000_000_000)
+    AMPConfig.load(str(toml))
+
+    # Make the cached copy distinguishable from the file
+    cached = loads(cache_path.read_bytes())
+    cached["data"]["app"]["log_level"] = "CACHED"
+    cache_path.write_text(dumps(cached))
+
+    assert AMPConfig.load(str(toml)).log_level == "CACHED"
+
+
+def test_edited_file_invalidates_the_cache(tmp_path, cache_path):
+    toml = tmp_path / "amp.toml"
+    _write_toml(toml, "DEBUG", 1_000_000_000)
+    AMPConfig.load(str(toml))
+
+    _write_toml(toml, "WARNING", 2_000_000_000)
+
+    assert AMPConfig.load(str(toml)).log_level == "WARNING"
+
+
+def test_cache_version_change_invalidates_the_cache(tmp_path, cache_path, monkeypatch):
+    toml = tmp_path / "amp.toml"
+    _write_toml(toml, "DEBUG", 1_000_000_000)
+    AMPConfig.load(str(toml))
+
+    cached = loads(cache_path.read_bytes())
+    cached["data"]["app"]["log_level"] = "CACHED"
+    cache_path.write_text(dumps(cached))
+    monkeypatch.setattr(amp_config, "CONFIG_CACHE_VERSION", amp_config.CONFIG_CACHE_VERSION + 1)
+
+    assert AMPConfig.load(str(toml)).log_level == "DEBUG"
+
+
+def test_corrupt_cache_falls_back_to_the_file(tmp_path, cache_path):
+    toml = tmp_path / "amp.toml"
+    _write_toml(toml, "DEBUG", 1_000_000_000)
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text("not json")
+
+    assert AMPConfig.load(str(toml)).log_level == "DEBUG"
+
+
+def test_amp_debug_bypasses_the_cache(tmp_path, cache_path, monkeypatch):
+    monkeypatch.setenv("AMP_DEBUG", "1")
+    toml = tmp_path / "amp.toml"
+    _write_toml(toml, "DEBUG", 1_000_000_000)
+
+    AMPConfig.load(str(toml))
+
+    assert not cache_path.exists()
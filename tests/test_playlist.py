@@ -0,0 +1,75 @@
+"""Tests for amp.models.playlist."""
+
+from amp.models import Playlist, Track
+
+
+def _track(n, duration_ms=1000):
+    return Track(uri=f"spotify:track:{n}", name=f"Song {n}", artists=["Artist"], duration_ms=duration_ms)
+
+
+def _playlist(*tracks):
+    return Playlist(uri="spotify:playlist:p", name="Mix", tracks=list(tracks), total_tracks=len(tracks))
+
+
+def test_remove_track_removes_the_first_match():
+    a, b, a_again = _track(1, 1000), _track(2, 2000), _track(1, 3000)
+    playlist = _playlist(a, b, a_again)
+
+    assert playlist.remove_track("spotify:track:1")
+
+    assert playlist.tracks == [b, a_again]
+    assert playlist.tracks[1] is a_again
+    assert playlist.total_tracks == 2
+    assert playlist.duration_ms == 5000
+
+
+def test_remove_track_returns_false_for_unknown_uri():
+    playlist = _playlist(_track(1))
+    assert not playlist.remove_track("spotify:track:missing")
+    assert playlist.total_tracks == 1
+
+
+def test_remove_track_after_direct_list_changes():
+    a, b = _track(1, 1000), _track(2, 2000)
+    playlist = _playlist(a)
+    assert playlist.duration_ms == 1000
+    playlist.tracks.insert(0, b)
+
+    assert playlist.remove_track("spotify:track:1")
+    assert playlist.tracks == [b]
+    assert playlist.duration_ms == 2000
+
+
+def test_duration_follows_direct_list_changes():
+    playlist = Playlist(uri="spotify:playlist:p", name="Mix")
+    playlist.tracks.append(_track(1, 1000))
+    assert playlist.duration_ms == 1000
+
+    playlist.tracks = [_track(2, 2000), _track(3, 3000)]
+    assert playlist.duration_ms == 5000
+
+
+def test_add_then_remove_keeps_duration_in_step():
+    playlist = _playlist()
+    playlist.add_track(_track(1, 1000))
+    playlist.add_track(_track(2, 2000))
+    playlist.remove_track("spotify:track:1")
+
+    assert playlist.duration_ms == 2000
+    assert playlist.total_tracks == 1
+
+
+def test_remove_many():
+    playlist = _playlist(_track(1, 1000), _track(2, 2000), _track(1, 3000), _track(3, 4000))
+
+    assert playlist.remove_many(["spotify:track:1", "spotify:track:missing"]) == 2
+
+    assert [t.uri for t in playlist.tracks] == ["spotify:track:2", "spotify:track:3"]
+    assert playlist.total_tracks == 2
+    assert playlist.duration_ms == 6000
+
+
+def test_remove_many_without_matches_changes_nothing():
+    playlist = _playlist(_track(1))
+    assert playlist.remove_many(["spotify:track:missing"]) == 0
+    assert playlist.total_tracks == 1
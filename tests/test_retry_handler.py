@@ -0,0 +1,80 @@
+"""Tests for amp.utils.retry_handler."""
+
+import time
+
+from amp.utils.retry_handler import debounce, is_retryable
+
+
+class _HTTPError(Exception):
+    """Stand-in for SpotifyException, which carries http_status."""
+
+    def __init__(self, http_status):
+        super().__init__(f"HTTP {http_status}")
+        self.http_status = http_status
+
+
+def test_programming_errors_are_not_retryable():
+    assert not is_retryable(TypeError("bad argument"))
+    assert not is_retryable(ValueError("bad value"))
+    assert not is_retryable(AttributeError("missing"))
+
+
+def test_network_errors_are_retryable():
+    assert is_retryable(ConnectionError("reset"))
+    assert is_retryable(TimeoutError("slow"))
+
+
+def test_client_errors_are_not_retryable():
+    for status in (400, 401, 403, 404):
+        assert not is_retryable(_HTTPError(status))
+
+
+def test_server_errors_and_rate_limits_are_retryable():
+    for status in (429, 500, 502, 503):
+        assert is_retryable(_HTTPError(status))
+
+
+class _Player:
+    def __init__(self):
+        self.calls = []
+
+    @debounce(0.2)
+    def skip(self, n):
+        self.calls.append(n)
+        return f"skipped {n}"
+
+    @debounce(0.2)
+    def pause(self):
+        self.calls.append("pause")
+        return "Error: no device" if len(self.calls) == 1 else "Paused"
+
+
+def test_debounce_drops_repeats_and_returns_the_previous_result():
+    player = _Player()
+    assert player.skip(1) == "skipped 1"
+    assert player.skip(2) == "skipped 1"
+    assert player.calls == [1]
+
+
+def test_debounce_runs_again_after_the_interval():
+    player = _Player()
+    player.skip(1)
+    time.sleep(0.25)
+    assert player.skip(2) == "skipped 2"
+    assert player.calls == [1, 2]
+
+
+def test_debounce_state_is_per_instance():
+    first, second = _Player(), _Player()
+    first.skip(1)
+    second.skip(2)
+    assert first.calls == [1]
+    assert second.calls == [2]
+
+
+def test_debounce_does_not_replay_errors():
+    player = _Player()
+    assert player.pause() == "Error: no device"
+    assert player.pause() == "Paused"
+    assert player.pause() == "Paused"
+    assert player.calls == ["pause", "pause"]
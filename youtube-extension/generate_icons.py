@@ -2,30 +2,35 @@
 """
 Generate extension icons for YouTube AI Music Agent
 Creates 16x16, 48x48, and 128x128 PNG icons
+
+A plain run writes uncompressed PNGs for a fast dev loop (icon128.png is
+about 49 KB instead of about 1 KB). The icons in icons/ are tracked, so
+regenerate them with --optimize before committing:
+    python generate_icons.py --optimize
+
+Requires Pillow. Pillow-SIMD is a drop-in replacement with faster
+resize/draw/encode paths:
+    pip uninstall pillow && pip install pillow-simd
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import PIL
+from PIL import Image, ImageDraw, ImageOps
+import hashlib
 import os
+import shutil
+import subprocess
 
 def create_gradient_background(size):
     """Create a purple gradient background."""
-    image = Image.new('RGB', (size, size))
-    draw = ImageDraw.Draw(image)
-
     # Purple gradient colors
     color1 = (102, 126, 234)  # #667eea
     color2 = (118, 75, 162)   # #764ba2
 
-    # Draw gradient
-    for y in range(size):
-        # Interpolate between colors
-        ratio = y / size
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        draw.line([(0, y), (size, y)], fill=(r, g, b))
-
-    return image
+    # Map a top-to-bottom ramp onto the two colors, all in Pillow's C code
+    ramp = Image.linear_gradient('L').resize((size, size))
+    return ImageOps.colorize(ramp, black=color1, white=color2)
 
 def draw_music_note(draw, size):
     """Draw a music note on the image."""
@@ -63,43 +68,117 @@ def draw_music_note(draw, size):
         fill='white'
     )
 
-def create_icon(size, output_path):
-    """Create a single icon of specified size."""
-    print(f"Creating {size}x{size} icon...")
-
-    # Create gradient background
-    image = create_gradient_background(size)
-    draw = ImageDraw.Draw(image)
-
-    # Draw music note
-    draw_music_note(draw, size)
-
-    # Save
-    image.save(output_path, 'PNG')
-    print(f"[OK] Saved: {output_path}")
-
-def main():
+# Note sprites by size; the 128px one is drawn, smaller ones are downscaled from it
+_NOTE_CACHE = {}
+
+def note_sprite(size):
+    """Return the white music note on a transparent size x size layer."""
+    sprite = _NOTE_CACHE.get(size)
+    if sprite is None:
+        if size == 128:
+            sprite = Image.new('RGBA', (128, 128), (0, 0, 0, 0))
+            draw_music_note(ImageDraw.Draw(sprite), 128)
+        else:
+            sprite = note_sprite(128).resize((size, size), Image.Resampling.LANCZOS)
+        _NOTE_CACHE[size] = sprite
+    return sprite
+
+# Gradient backgrounds by size, shared the same way as the note sprites
+_GRAD_CACHE = {}
+
+def gradient_background(size):
+    """Return the cached gradient for size, downscaled from the 128px one."""
+    background = _GRAD_CACHE.get(size)
+    if background is None:
+        if size == 128:
+            background = create_gradient_background(128)
+        else:
+            background = gradient_background(128).resize((size, size), Image.Resampling.LANCZOS)
+        _GRAD_CACHE[size] = background
+    return background
+
+def create_icon(size):
+    """Render a single icon of specified size."""
+    # Copy the cached gradient as RGBA, then lay the note over it
+    image = gradient_background(size).convert('RGBA')
+    image.alpha_composite(note_sprite(size))
+    return image.convert('RGB')
+
+def save_icon(size, output_path):
+    """Render a size x size icon and save it as an uncompressed PNG."""
+    create_icon(size).save(output_path, 'PNG', compress_level=0)
+    return output_path
+
+def optimize_icons(paths):
+    """Shrink the PNGs for packaging: oxipng if installed, else zlib level 9."""
+    oxipng = shutil.which('oxipng')
+    if oxipng:
+        subprocess.run([oxipng, '-o', '4', '--quiet', *paths], check=True)
+        return
+    for path in paths:
+        with Image.open(path) as image:
+            image.load()
+            image.save(path, 'PNG', compress_level=9)
+
+def design_key(sizes, optimize):
+    """Hash everything that affects the output: this script, the options and Pillow."""
+    with open(__file__, 'rb') as f:
+        source = f.read()
+    return hashlib.sha256(repr((source, sizes, optimize, PIL.__version__)).encode()).hexdigest()
+
+def main(argv=None):
     """Generate all required icons."""
-    print("YouTube AI Music Agent - Icon Generator\n")
+    parser = argparse.ArgumentParser(description="Generate the extension icons.")
+    parser.add_argument('-v', '--verbose', action='store_true', help="report progress and next steps")
+    parser.add_argument('--optimize', action='store_true', help="compress the PNGs; use before committing the tracked icons")
+    args = parser.parse_args(argv)
+
+    # Silent unless asked, so repeated build runs stay quiet
+    log = print if args.verbose else (lambda *a, **k: None)
+    log("YouTube AI Music Agent - Icon Generator\n")
 
     # Create icons directory if it doesn't exist
     icons_dir = os.path.join(os.path.dirname(__file__), 'icons')
     os.makedirs(icons_dir, exist_ok=True)
 
-    # Generate icons
     sizes = [16, 48, 128]
-    for size in sizes:
-        output_path = os.path.join(icons_dir, f'icon{size}.png')
-        create_icon(size, output_path)
-
-    print("\nAll icons generated successfully!")
-    print(f"Icons saved in: {icons_dir}")
-    print("\nNext steps:")
-    print("1. Open Chrome → chrome://extensions/")
-    print("2. Enable Developer mode")
-    print("3. Click 'Load unpacked'")
-    print("4. Select the youtube-extension folder")
-    print("5. Configure your API key in the extension popup")
+    paths = [os.path.join(icons_dir, f'icon{size}.png') for size in sizes]
+
+    # Skip rendering when the icons were already built from this exact design
+    key = design_key(sizes, args.optimize)
+    key_path = os.path.join(icons_dir, '.cache_key')
+    if os.path.exists(key_path) and all(os.path.exists(p) for p in paths):
+        with open(key_path) as f:
+            if f.read().strip() == key:
+                log(f"Icons are up to date in: {icons_dir}")
+                return
+
+    # Draw the gradient and note once up front; each size only resizes and composites them.
+    # Resizing and PNG encoding release the GIL, so the sizes are written in parallel.
+    gradient_background(max(sizes))
+    note_sprite(max(sizes))
+    with ThreadPoolExecutor(max_workers=len(sizes)) as pool:
+        saved = pool.map(save_icon, sizes, paths)
+        # Report from this thread, in size order; iterating also surfaces worker errors
+        for size, output_path in zip(sizes, saved):
+            log(f"[OK] Saved {size}x{size}: {output_path}")
+
+    # Dev runs keep the raw PNGs; compression is a separate packaging pass
+    if args.optimize:
+        optimize_icons(paths)
+        log("[OK] Optimized icons for packaging")
+
+    with open(key_path, 'w') as f:
+        f.write(key)
+
+    log("\nAll icons generated successfully!")
+    log(f"Icons saved in: {icons_dir}")
+    log("\nNext steps:")
+    log("1. Open Chrome → chrome://extensions/")
+    log("2. Enable Developer mode")
+    log("3. Click 'Load unpacked'")
+    log("4. Select the youtube-extension folder")
+    log("5. Configure your API key in the extension popup")
 
 if __name__ == '__main__':
     main()